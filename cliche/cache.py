@@ -0,0 +1,76 @@
+"""
+On-disk cache for LLM responses
+"""
+import hashlib
+import sqlite3
+import time
+from pathlib import Path
+from typing import Optional
+
+CACHE_FILE = Path.home() / ".config" / "cliche" / "cache.sqlite"
+
+def make_cache_key(provider: str, model: Optional[str], query: str,
+                   include_sys_info: bool = False, professional_mode: bool = False) -> str:
+    """Build the cache key for a query sent to a provider/model.
+    
+    The system-context flags are part of the key, since they change the
+    prompt the model answers.
+    """
+    return hashlib.blake2b(repr((provider, model, query, include_sys_info, professional_mode)).encode()).hexdigest()
+
+class ResponseCache:
+    """SQLite-backed store of LLM responses keyed by a hash of the provider, model, query and context flags."""
+
+    def __init__(self, ttl: float, path: Path = CACHE_FILE):
+        """
+        Args:
+            ttl: Seconds a stored response stays valid. Every entry expires;
+                answers mention the time and the machine's state, so none
+                stays correct forever.
+            path: SQLite database file
+        """
+        self.ttl = ttl
+        self.path = path
+        self._conn = None
+
+    def _connect(self) -> sqlite3.Connection:
+        """Open the database on first use, creating it if needed."""
+        if self._conn is None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            self._conn = sqlite3.connect(self.path)
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS responses "
+                "(key TEXT PRIMARY KEY, response TEXT, ts REAL)"
+            )
+        return self._conn
+
+    def get(self, key: str) -> Optional[str]:
+        """Get a cached response, or None on a miss."""
+        try:
+            row = self._connect().execute(
+                "SELECT response, ts FROM responses WHERE key = ?", (key,)
+            ).fetchone()
+        except (sqlite3.Error, OSError):
+            # An unreadable cache shouldn't stop the query from going through
+            return None
+        if row is None or time.time() - row[1] > self.ttl:
+            return None
+        return row[0]
+
+    def set(self, key: str, response: str) -> None:
+        """Store a response, replacing any previous one for the key."""
+        try:
+            conn = self._connect()
+            with conn:
+                conn.execute(
+                    "INSERT OR REPLACE INTO responses (key, response, ts) VALUES (?, ?, ?)",
+                    (key, response, time.time())
+                )
+        except (sqlite3.Error, OSError):
+            pass
+
+    def close(self) -> None:
+        """Close the database connection."""
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
@@ -3,12 +3,37 @@ LLM interaction commands
 """
 import asyncio
 import click
+from typing import AsyncIterator
 from ..core import cli, CLIche
 
+PLAIN_TEXT_PREFIX = "Respond to this query in plain text format without markdown formatting: "
+
+async def _print_stream(chunks: AsyncIterator[str]) -> None:
+    """Print response chunks as they arrive."""
+    async for chunk in chunks:
+        click.echo(chunk, nl=False)
+    click.echo()
+
 @cli.command()
 @click.argument('query', nargs=-1)
-def ask(query):
+@click.option('--batch-file', type=click.File('r'), help='File with one query per line (- for stdin), asked concurrently')
+@click.option('--no-cache', is_flag=True, help='Always ask the LLM instead of reusing a cached response')
+def ask(query, batch_file, no_cache):
     """Ask CLIche anything"""
+    if batch_file:
+        queries = [line.strip() for line in batch_file if line.strip()]
+        if not queries:
+            click.echo("Error: Batch file is empty, genius. Give me something to work with!")
+            return
+
+        click.echo(f"🤔 CLIche is pondering {len(queries)} queries (and judging all of them)...")
+
+        assistant = CLIche()
+        responses = asyncio.run(assistant.ask_many([PLAIN_TEXT_PREFIX + q for q in queries], use_cache=not no_cache))
+        for query_str, response in zip(queries, responses):
+            click.echo(f"\n❓ {query_str}\n💡 {response}")
+        return
+
     if not query:
         click.echo("Error: No query provided, genius. Please type something!")
         return
@@ -17,5 +42,5 @@ def ask(query):
     click.echo("🤔 CLIche is pondering (and judging)...")
     
     assistant = CLIche()
-    response = asyncio.run(assistant.ask_llm(f"Respond to this query in plain text format without markdown formatting: {query_str}"))
-    click.echo(f"\n💡 {response}")
\ No newline at end of file
+    click.echo("\n💡 ", nl=False)
+    asyncio.run(_print_stream(assistant.stream_llm(f"{PLAIN_TEXT_PREFIX}{query_str}", use_cache=not no_cache)))
@@ -3,9 +3,16 @@ Configuration management commands
 """
 import click
 import asyncio
+import functools
 import os
 from typing import Optional
 from ..core import Config, LLMProvider, CLIche
+from ..providers import get_provider_class
+
+@functools.lru_cache(maxsize=1)
+def _get_config() -> Config:
+    """Get the shared Config instance, loading it on first use."""
+    return Config()
 
 @click.command()
 @click.option('--provider', type=click.Choice([p.value for p in LLMProvider]), help='Set active LLM provider')
@@ -22,7 +29,7 @@ def config(provider: Optional[str], api_key: Optional[str], model: Optional[str]
            stability_key: Optional[str], dalle_key: Optional[str],
            image_provider: Optional[str], image_model: Optional[str]):
     """Configure CLIche settings"""
-    config = Config()
+    config = _get_config()
     
     # Handle Unsplash API key
     if unsplash_key:
@@ -143,6 +150,8 @@ def config(provider: Optional[str], api_key: Optional[str], model: Optional[str]
             config.config['providers'][active_provider]['api_key'] = api_key
 
     config.save_config(config.config)
+    # Drop the cached instance so later reads pick up the saved file
+    _get_config.cache_clear()
     
     # Add clear instructions for common commands
     if image_provider or image_model:
@@ -157,20 +166,19 @@ def config(provider: Optional[str], api_key: Optional[str], model: Optional[str]
 @click.option('--provider', type=click.Choice([p.value for p in LLMProvider]), help='Provider to list models for')
 def models(provider: Optional[str]):
     """List available models for the specified or active provider"""
-    config = Config()
-    current_config = config.config
+    # The shared CLIche already holds the loaded config and the active provider
+    cliche = CLIche.get_instance()
+    active_provider = cliche.config.config["provider"]
     
     # Use specified provider or active provider
-    provider_name = provider or current_config["provider"]
-    
-    # Create a new config instance for the specified provider
-    temp_config = Config()
-    temp_config.config["provider"] = provider_name
+    provider_name = provider or active_provider
     
-    # Create CLIche instance with temporary config
-    cliche = CLIche()
-    cliche.config = temp_config
-    provider_instance = cliche._get_provider()
+    if provider_name == active_provider and cliche.provider is not None:
+        provider_instance = cliche.provider
+    else:
+        # Build the requested provider from the same config, without switching the active one
+        provider_class = get_provider_class(provider_name)
+        provider_instance = provider_class(cliche.config.get_provider_config(provider_name))
     
     try:
         # Get models from provider
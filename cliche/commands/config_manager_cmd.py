@@ -60,8 +60,8 @@ def reset_config():
     if backup_path:
         click.echo(f"Created backup at {backup_path}")
     
-    # Save default config
-    config_manager.save_config(config_manager.DEFAULT_CONFIG)
+    # Save default config; the backup above already covers it
+    config_manager.save_config(config_manager.DEFAULT_CONFIG, backup=False)
     click.echo(f"Reset config file to default values at {config_manager.get_config_path()}")
 
 @config_manager_cmd.command(name="edit", help="Open config file in an editor")
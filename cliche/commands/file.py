@@ -2,15 +2,40 @@
 File management commands
 """
 import click
+import errno
 import os
 import fnmatch
+import functools
 import subprocess
 import shutil
 import asyncio
+import atexit
 import re
 from pathlib import Path
 import stat
-from typing import Optional, List, Tuple
+import queue
+from concurrent.futures import ThreadPoolExecutor
+from typing import Iterator, Optional, List, Tuple
+
+# Event loop reused by every LLM call made from this module, instead of
+# setting up and tearing down a new one per asyncio.run()
+_LOOP: Optional[asyncio.AbstractEventLoop] = None
+
+def _run(coro):
+    """Run a coroutine on the shared event loop, creating it on first use."""
+    global _LOOP
+    if _LOOP is None or _LOOP.is_closed():
+        _LOOP = asyncio.new_event_loop()
+    return _LOOP.run_until_complete(coro)
+
+def _close_loop() -> None:
+    """Close the shared event loop at exit."""
+    if _LOOP is not None and not _LOOP.is_closed():
+        # Finalizing async generators closes the loop's pooled HTTP sessions
+        _LOOP.run_until_complete(_LOOP.shutdown_asyncgens())
+        _LOOP.close()
+
+atexit.register(_close_loop)
 
 def get_file_size_str(size: int) -> str:
     """Convert file size to human readable string."""
@@ -53,13 +78,101 @@ def search_with_fd(name: str, path: str, hidden: bool, case_sensitive: bool,
     except subprocess.CalledProcessError as e:
         return False, [], str(e)
 
-def search_with_find(name: str, path: str, hidden: bool, max_depth: Optional[int]) -> List[str]:
+# Directories that never contain files worth finding
+_SPECIAL_DIRS = frozenset({
+    '__pycache__', '.git', '.pytest_cache', '.mypy_cache',
+    '.coverage', '.tox', '.env', '.venv', 'venv', 'node_modules',
+    'build', 'dist', '.idea', '.vs', '.vscode', 'vendor', 'go'
+})
+
+# Virtual filesystems that are never descended into
+_SKIP_PATHS = frozenset({'/proc', '/sys', '/dev', '/run', '/snap'})
+
+# find(1) expression that prunes _SKIP_PATHS: ( -path /dev -o -path /proc ... ) -prune -o
+_FIND_PRUNE_ARGS = ['('] + ' -o '.join(f'-path {p}' for p in sorted(_SKIP_PATHS)).split() + [')', '-prune', '-o']
+
+# Directory listing is I/O bound and scandir releases the GIL, so threads scale well
+_SCAN_WORKERS = min(32, (os.cpu_count() or 4) * 4)
+
+def _scan_dir(path: str, hidden: bool, max_depth: Optional[int], depth: int) -> Tuple[List[Tuple[str, int]], List[os.DirEntry]]:
+    """List one directory.
+    
+    os.scandir reports each entry's type from the directory listing itself,
+    so no extra stat() call is needed per file.
+    
+    Returns:
+        (subdirectories to descend into with their depth, non-directory entries)
+    """
+    subdirs, files = [], []
+    try:
+        with os.scandir(path) as it:
+            for entry in it:
+                if not hidden and entry.name.startswith('.'):
+                    continue
+                try:
+                    if entry.is_dir(follow_symlinks=False):
+                        if (entry.name not in _SPECIAL_DIRS and entry.path not in _SKIP_PATHS
+                                and (max_depth is None or depth < max_depth)):
+                            subdirs.append((entry.path, depth + 1))
+                    else:
+                        files.append(entry)
+                except OSError:
+                    continue
+    except OSError:
+        pass
+    return subdirs, files
+
+def _scan(path: str, hidden: bool, max_depth: Optional[int]) -> Iterator[os.DirEntry]:
+    """Recursively yield the non-directory entries under path.
+    
+    Directories are listed concurrently by a thread pool; this generator
+    schedules subdirectories as listings come back and yields their files.
+    """
+    results = queue.SimpleQueue()
+
+    def worker(dirpath: str, depth: int) -> None:
+        try:
+            results.put(_scan_dir(dirpath, hidden, max_depth, depth))
+        except BaseException:
+            # Always report back so the in-flight count can't hang
+            results.put(([], []))
+            raise
+
+    pool = ThreadPoolExecutor(max_workers=_SCAN_WORKERS)
+    try:
+        pool.submit(worker, path, 0)
+        in_flight = 1
+        while in_flight:
+            subdirs, files = results.get()
+            in_flight -= 1
+            for subdir, depth in subdirs:
+                pool.submit(worker, subdir, depth)
+                in_flight += 1
+            yield from files
+    finally:
+        # Stop queued listings if the caller stops consuming early
+        pool.shutdown(wait=True, cancel_futures=True)
+
+@functools.lru_cache(maxsize=128)
+def _compile_glob(pattern: str, case_sensitive: bool):
+    """Compile a glob into a match function, reusing it for repeated patterns.
+    
+    Translating once avoids fnmatch re-parsing the glob for every file.
+    """
+    flags = 0 if case_sensitive else re.IGNORECASE
+    return re.compile(fnmatch.translate(pattern), flags).match
+
+def search_with_find(name: str, path: str, hidden: bool, max_depth: Optional[int],
+                     case_sensitive: bool = True) -> List[str]:
     """Search files using find command as fallback."""
     cmd = ['find', path]
     
     if max_depth is not None:
         cmd.extend(['-maxdepth', str(max_depth)])
     
+    # Don't descend into virtual filesystems at all
+    cmd.extend(_FIND_PRUNE_ARGS)
+    
     # Skip special directories
     cmd.extend([
         '(',
@@ -87,44 +200,41 @@ def search_with_find(name: str, path: str, hidden: bool, max_depth: Optional[int
         cmd.extend(['-a', '!', '-path', '*/.*'])  # Exclude hidden files
         
     # Convert glob pattern to find pattern
+    name_test = '-name' if case_sensitive else '-iname'
     if '*' in name or '?' in name:
-        cmd.extend(['-a', '-name', name])
+        cmd.extend(['-a', name_test, name])
     else:
-        cmd.extend(['-a', '-name', f'*{name}*'])
+        cmd.extend(['-a', name_test, f'*{name}*'])
+    # Explicit -print so pruned directories themselves aren't listed
+    cmd.append('-print')
     
     try:
-        result = subprocess.run(cmd, capture_output=True, text=True)
+        # find's permission-denied noise is never shown, so don't pipe stderr
+        result = subprocess.run(cmd, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL, text=True)
         if result.returncode == 0:
             return [m for m in result.stdout.strip().split('\n') if m]
     except Exception:
         pass
         
-    # If find command fails, fall back to os.walk
-    matches = []
+    # If find command fails, fall back to a Python walk
     name_pattern = f"*{name}*" if '*' not in name and '?' not in name else name
-    special_dirs = {
-        '__pycache__', '.git', '.pytest_cache', '.mypy_cache',
-        '.coverage', '.tox', '.env', '.venv', 'venv', 'node_modules',
-        'build', 'dist', '.idea', '.vs', '.vscode', 'vendor', 'go'
-    }
-                   
-    for root, dirnames, filenames in os.walk(path):
-        # Skip special directories
-        dirnames[:] = [d for d in dirnames if d not in special_dirs]
-        if not hidden:
-            # Skip hidden directories
-            dirnames[:] = [d for d in dirnames if not d.startswith('.')]
-            
-        if max_depth is not None:
-            # Skip if we're too deep
-            rel_path = os.path.relpath(root, path)
-            if rel_path != '.' and len(rel_path.split(os.sep)) > max_depth:
-                continue
-                
-        for filename in fnmatch.filter(filenames, name_pattern):
-            if hidden or not filename.startswith('.'):
-                matches.append(os.path.join(root, filename))
-    return matches
+    matcher = _compile_glob(name_pattern, case_sensitive)
+    return [entry.path for entry in _scan(path, hidden, max_depth)
+            if matcher(entry.name) is not None]
+
+def _relpath_under(match: str, root_prefix: str, root: str) -> str:
+    """Get a match's path relative to the search root.
+    
+    os.path.relpath normalizes both paths on every call (and calls getcwd()
+    for relative ones); matches already start with the root, so slicing the
+    prefix off is enough. Anything else goes through relpath.
+    """
+    if match.startswith(root_prefix):
+        return match[len(root_prefix):]
+    return os.path.relpath(match, root)
+
+# Number of result lines written per click.echo() call
+_ECHO_BATCH_SIZE = 64
 
 @click.command()
 @click.option('--name', '-n', help='File name pattern (e.g., *.txt)')
@@ -179,67 +289,114 @@ def find(name: Optional[str], filetype: Optional[str], path: str | None, hidden:
                 click.echo("  macOS: brew install fd")
                 click.echo("  Arch Linux: sudo pacman -S fd")
                 click.echo("\nFalling back to find command...\n")
-            matches = search_with_find(name, search_path, hidden, max_depth)
+            matches = search_with_find(name, search_path, hidden, max_depth, case_sensitive)
             
         if not matches:
             click.echo("No matching files found")
             return
             
         click.echo("\nFound files:")
-        for match in matches:
-            try:
-                size = os.path.getsize(match)
-                size_str = get_file_size_str(size)
-                # Show path relative to search directory
-                rel_path = os.path.relpath(match, search_path)
-                if os.path.isdir(match):
-                    click.echo(f" {rel_path}/")
-                else:
-                    click.echo(f" {rel_path} ({size_str})")
-            except OSError:
-                # If we can't get the size, just show the path
-                click.echo(f"- {match}")
+        # Matches come back under search_path, so compute the prefix to strip once
+        root_prefix = search_path if search_path.endswith(os.sep) else search_path + os.sep
+        # Emit matches in batches rather than one write per line
+        lines = []
+        try:
+            for match in matches:
+                try:
+                    size = os.path.getsize(match)
+                    size_str = get_file_size_str(size)
+                    # Show path relative to search directory
+                    rel_path = _relpath_under(match, root_prefix, search_path)
+                    if os.path.isdir(match):
+                        lines.append(f" {rel_path}/")
+                    else:
+                        lines.append(f" {rel_path} ({size_str})")
+                except OSError:
+                    # If we can't get the size, just show the path
+                    lines.append(f"- {match}")
+                if len(lines) >= _ECHO_BATCH_SIZE:
+                    click.echo("\n".join(lines))
+                    lines.clear()
+        finally:
+            # Still print what we have if interrupted with Ctrl+C
+            if lines:
+                click.echo("\n".join(lines))
                 
     except Exception as e:
         click.echo(f"Error searching files: {str(e)}")
 
-@click.command()
-@click.argument('source')
-@click.argument('target')
-@click.option('--force', '-f', is_flag=True, help='Force rename even if target exists')
-def rename(source: str, target: str, force: bool) -> None:
-    """Rename a file or directory."""
-    try:
-        source_path = Path(source)
-        target_path = Path(target)
-        
-        if not source_path.exists():
-            click.echo(f"Source '{source}' does not exist")
-            return
-            
-        if target_path.exists() and not force:
-            click.echo(f"Target '{target}' already exists. Use --force to overwrite")
-            return
-            
-        # Create parent directories if they don't exist
-        target_path.parent.mkdir(parents=True, exist_ok=True)
-        
-        # Handle read-only files
-        if source_path.is_file() and not os.access(str(source_path), os.W_OK):
-            os.chmod(str(source_path), stat.S_IWRITE)
-            
-        if target_path.exists() and force:
-            if target_path.is_file():
-                os.chmod(str(target_path), stat.S_IWRITE)
-            target_path.unlink()
-            
-        source_path.rename(target_path)
-        click.echo(f"Renamed '{source}' to '{target}'")
-        
-    except PermissionError:
-        click.echo(f"Permission denied: Unable to rename '{source}' to '{target}'")
-    except OSError as e:
-        click.echo(f"Error renaming file: {str(e)}")
+# Generated documents that already declare a doctype (any case, after any
+# leading whitespace or BOM) are left alone instead of being wrapped again
+_DOCTYPE_RE = re.compile(r'[\s\ufeff]*<!doctype', re.IGNORECASE)
+
+# Map common language aliases to full names
+_LANG_MAP = {
+    'py': 'python',
+    'js': 'javascript',
+    'ts': 'typescript',
+    'rb': 'ruby',
+    'rs': 'rust',
+    'cpp': 'c++',
+    'cs': 'c#',
+}
+
+# Map file extensions
+_EXT_MAP = {
+    'python': '.py',
+    'javascript': '.js',
+    'typescript': '.ts',
+    'ruby': '.rb',
+    'rust': '.rs',
+    'go': '.go',
+    'c++': '.cpp',
+    'c#': '.cs',
+    'java': '.java',
+    'php': '.php',
+    'swift': '.swift',
+    'kotlin': '.kt',
+}
+
+# Types written to disk exactly as the LLM returns them, so they can be
+# streamed straight to the file
+_STREAMED_TYPES = frozenset({'text', 'markdown'})
+
+def _default_write_path(prompt: str, type: str, lang: Optional[str]) -> str:
+    """Get the default save path for write, under ~/.cliche/files/[type]."""
+    # Save files to ~/.cliche/files/[type]
+    cliche_dir = Path.home() / '.cliche' / 'files' / type
+
+    # Generate a default filename based on content type
+    base_name = prompt.lower().replace(' ', '_')[:30]
+
+    # Determine file extension
+    if type == 'code':
+        if lang:
+            # Handle special case for JavaScript animations
+            if lang == 'js' and any(kw in prompt.lower() for kw in ['animation', 'canvas', 'game', 'visual']):
+                ext = '.html'
+            else:
+                # Use mapped extension or lang directly
+                language = _LANG_MAP.get(lang, lang)
+                ext = _EXT_MAP.get(language, f".{lang}")
+        else:
+            ext = '.py'  # Default to Python
+    elif type == 'markdown':
+        ext = '.md'
+    elif type == 'html':
+        ext = '.html'
+    else:
+        ext = '.txt'
+
+    return str(cliche_dir / f"{base_name}{ext}")
+
+async def _stream_to_file(cliche, prompt: str, path: str, use_cache: bool = True) -> None:
+    """Write the LLM's response to a file as it arrives."""
+    import aiofiles
+    # Create parent directories if they don't exist
+    Path(path).parent.mkdir(parents=True, exist_ok=True)
+    async with aiofiles.open(path, 'w') as f:
+        async for chunk in cliche.stream_llm(prompt, use_cache=use_cache):
+            await f.write(chunk)
 
 @click.command()
 @click.argument('prompt')
@@ -248,8 +405,9 @@ def rename(source: str, target: str, force: bool) -> None:
 @click.option('--lang', '-l', help='Programming language for code (e.g., py, js, go, rust)')
 @click.option('--path', '-p', type=click.Path(), help='Path to save the file')
 @click.option('--generate', '-g', is_flag=True, help='Generate content using AI')
+@click.option('--no-cache', is_flag=True, help='Always ask the LLM instead of reusing a cached response')
 def write(prompt: str, type: str, lang: Optional[str], path: Optional[str],
-          generate: bool) -> None:
+          generate: bool, no_cache: bool) -> None:
     """Write or generate content and save to a file.
     
     Examples:
@@ -268,21 +426,10 @@ def write(prompt: str, type: str, lang: Optional[str], path: Optional[str],
             from ..core import CLIche
             cliche = CLIche()
             
-            # Map common language aliases to full names
-            lang_map = {
-                'py': 'python',
-                'js': 'javascript',
-                'ts': 'typescript',
-                'rb': 'ruby',
-                'rs': 'rust',
-                'cpp': 'c++',
-                'cs': 'c#',
-            }
-            
             # Customize prompt based on content type and language
             if type == 'code':
                 # Get full language name
-                language = lang_map.get(lang, lang) if lang else 'python'
+                language = _LANG_MAP.get(lang, lang) if lang else 'python'
                 
                 # Special handling for languages that need specific structure
                 if language == 'rust':
@@ -310,12 +457,23 @@ The generated response should be a complete, valid HTML document with DOCTYPE, h
             else:
                 gen_prompt = f"Generate {type} content for: {prompt}"
                 
-            response = asyncio.run(cliche.ask_llm(gen_prompt))
+            if type in _STREAMED_TYPES:
+                # Nothing gets extracted from these, so write chunks as they arrive
+                if not path:
+                    path = _default_write_path(prompt, type, lang)
+                try:
+                    _run(_stream_to_file(cliche, gen_prompt, path, use_cache=not no_cache))
+                    click.echo(f"\nContent written to: {path}")
+                except PermissionError:
+                    click.echo(f"Permission denied: Unable to write to {path}")
+                return
+                
+            response = _run(cliche.ask_llm(gen_prompt, use_cache=not no_cache))
             
             # Extract content based on type
             if type == 'code':
                 # First try to find code blocks for the specific language
-                lang_pattern = fr'```(?:{lang}|{lang_map.get(lang, "")})\n(.*?)\n```' if lang else r'```(?:\w+)?\n(.*?)\n```'
+                lang_pattern = fr'```(?:{lang}|{_LANG_MAP.get(lang, "")})\n(.*?)\n```' if lang else r'```(?:\w+)?\n(.*?)\n```'
                 code_blocks = re.findall(lang_pattern, response, re.DOTALL)
                 
                 if code_blocks:
@@ -350,7 +508,7 @@ The generated response should be a complete, valid HTML document with DOCTYPE, h
                         content = response
                         
                 # Ensure proper HTML structure
-                if not content.strip().startswith('<!DOCTYPE'):
+                if not _DOCTYPE_RE.match(content):
                     content = f"""<!DOCTYPE html>
 <html lang="en">
 <head>
@@ -377,52 +535,11 @@ The generated response should be a complete, valid HTML document with DOCTYPE, h
             return
         
     if not path:
-        # Save files to ~/.cliche/files/[type]
-        cliche_dir = Path.home() / '.cliche' / 'files' / type
-        cliche_dir.mkdir(parents=True, exist_ok=True)
-        
-        # Generate a default filename based on content type
-        base_name = prompt.lower().replace(' ', '_')[:30]
-        
-        # Map file extensions
-        ext_map = {
-            'python': '.py',
-            'javascript': '.js',
-            'typescript': '.ts',
-            'ruby': '.rb',
-            'rust': '.rs',
-            'go': '.go',
-            'c++': '.cpp',
-            'c#': '.cs',
-            'java': '.java',
-            'php': '.php',
-            'swift': '.swift',
-            'kotlin': '.kt',
-        }
-        
-        # Determine file extension
-        if type == 'code':
-            if lang:
-                # Handle special case for JavaScript animations
-                if lang == 'js' and any(kw in prompt.lower() for kw in ['animation', 'canvas', 'game', 'visual']):
-                    ext = '.html'
-                else:
-                    # Use mapped extension or lang directly
-                    language = lang_map.get(lang, lang)
-                    ext = ext_map.get(language, f".{lang}")
-            else:
-                ext = '.py'  # Default to Python
-        elif type == 'markdown':
-            ext = '.md'
-        elif type == 'html':
-            ext = '.html'
-        else:
-            ext = '.txt'
-            
-        path = str(cliche_dir / f"{base_name}{ext}")
+        path = _default_write_path(prompt, type, lang)
         
     try:
-        # Create parent directories if they don't exist
+        # Create parent directories if they don't exist (the default path
+        # included, so it isn't created twice)
         Path(path).parent.mkdir(parents=True, exist_ok=True)
         
         with open(path, 'w') as f:
@@ -445,11 +562,18 @@ def rename(source: str, target: str, force: bool) -> None:
         source_path = Path(source)
         target_path = Path(target)
         
-        if not source_path.exists():
+        # Stat each path once and reuse the result for every check below
+        try:
+            source_st = os.lstat(source_path)
+        except FileNotFoundError:
             click.echo(f"Source '{source}' does not exist")
             return
             
-        if target_path.exists() and not force:
+        try:
+            target_st = os.lstat(target_path)
+        except FileNotFoundError:
+            target_st = None
+        if target_st is not None and not force:
             click.echo(f"Target '{target}' already exists. Use --force to overwrite")
             return
             
@@ -457,15 +581,36 @@ def rename(source: str, target: str, force: bool) -> None:
         target_path.parent.mkdir(parents=True, exist_ok=True)
         
         # Handle read-only files
-        if source_path.is_file() and not os.access(str(source_path), os.W_OK):
+        if stat.S_ISREG(source_st.st_mode) and not os.access(str(source_path), os.W_OK):
             os.chmod(str(source_path), stat.S_IWRITE)
             
-        if target_path.exists() and force:
-            if target_path.is_file():
+        if target_st is not None:
+            if stat.S_ISREG(target_st.st_mode) and not os.access(str(target_path), os.W_OK):
+                # Windows won't replace or delete a read-only file
                 os.chmod(str(target_path), stat.S_IWRITE)
-            target_path.unlink()
+            if stat.S_ISDIR(target_st.st_mode):
+                # Only an empty directory is ever replaced; --force never
+                # deletes a directory tree to make room
+                try:
+                    os.rmdir(target_path)
+                except OSError as e:
+                    if e.errno not in (errno.ENOTEMPTY, errno.EEXIST):
+                        raise
+                    click.echo(f"Target '{target}' is a non-empty directory. Refusing to overwrite it")
+                    return
+            elif stat.S_ISDIR(source_st.st_mode):
+                # A directory can't be renamed over a file, so remove the file first
+                target_path.unlink()
+            # A file replacing a file is left to os.replace, which swaps it atomically
             
-        source_path.rename(target_path)
+        try:
+            # Same filesystem: a single rename syscall
+            os.replace(source_path, target_path)
+        except OSError as e:
+            if e.errno != errno.EXDEV:
+                raise
+            # Across filesystems (or mounts) the data has to be copied
+            shutil.move(str(source_path), str(target_path))
         click.echo(f"Renamed '{source}' to '{target}'")
         
     except PermissionError:
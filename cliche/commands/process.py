@@ -5,6 +5,7 @@ import click
 import psutil
 import os
 import signal
+import time
 from typing import Optional
 
 def get_process_name(pid: int) -> Optional[str]:
@@ -15,28 +16,42 @@ def get_process_name(pid: int) -> Optional[str]:
     except (psutil.NoSuchProcess, psutil.AccessDenied):
         return None
 
+def _wait_for_exit(pid: int, timeout: float) -> bool:
+    """Poll until a process is gone, returning False if it outlives the timeout."""
+    deadline = time.monotonic() + timeout
+    delay = 0.01
+    while time.monotonic() < deadline:
+        try:
+            os.kill(pid, 0)
+        except ProcessLookupError:
+            return True
+        time.sleep(delay)
+        delay = min(delay * 2, 0.25)
+    return False
+
 @click.command()
 @click.argument('pid', type=int)
 def kill(pid: int):
     """Kill a process by PID"""
     try:
-        process = psutil.Process(pid)
-        process_name = process.name()
+        # Try SIGTERM first, signalling the PID directly
+        os.kill(pid, signal.SIGTERM)
         
-        # Try SIGTERM first
-        process.terminate()
+        # The name is only for the message, so it is looked up once the signal
+        # has gone through; a process that already exited is shown by PID alone
+        process_name = get_process_name(pid)
+        label = f"{pid} ({process_name})" if process_name else str(pid)
         
-        try:
-            process.wait(timeout=3)
-            click.echo(f"Process {pid} ({process_name}) terminated successfully")
-        except psutil.TimeoutExpired:
-            # If SIGTERM didn't work, try SIGKILL
-            process.kill()
-            click.echo(f"Process {pid} ({process_name}) killed forcefully")
+        if _wait_for_exit(pid, timeout=3):
+            click.echo(f"Process {label} terminated successfully")
+        else:
+            # If SIGTERM didn't work, try SIGKILL (Windows has no SIGKILL)
+            os.kill(pid, getattr(signal, 'SIGKILL', signal.SIGTERM))
+            click.echo(f"Process {label} killed forcefully")
             
-    except psutil.NoSuchProcess:
+    except ProcessLookupError:
         click.echo(f"No process found with PID {pid}")
-    except psutil.AccessDenied:
+    except PermissionError:
         click.echo(f"Permission denied to kill process {pid}")
     except Exception as e:
         click.echo(f"Error killing process {pid}: {str(e)}")
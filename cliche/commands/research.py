@@ -14,6 +14,9 @@ from ..core import cli, CLIche, get_llm
 from ..utils.file import save_text_to_file, get_docs_dir, get_unique_filename
 from ..utils.unsplash import UnsplashAPI, format_image_for_markdown, format_image_for_html, get_photo_credit
 
+# A doctype at the start of a response, in any case and after whitespace or a BOM
+_DOCTYPE_RE = re.compile(r'[\s\ufeff]*<!doctype', re.IGNORECASE)
+
 # Initialize console for rich output
 console = Console()
 
@@ -604,14 +607,15 @@ def research(query, depth, debug, fallback_only, write, format, filename,
         if snippet or summarize:
             # For snippets or summaries, we don't need chunking
             # Combine a limited amount of data from all sources
-            combined_sources_info = ""
             source_limit = 2000 if snippet else 5000  # Very limited for snippets
             
+            source_parts = []
             for idx, data in enumerate(all_extracted_data, 1):
                 excerpt_length = min(source_limit // len(all_extracted_data), len(data['content']))
-                combined_sources_info += f"Source {idx}: {data['title']}\n"
-                combined_sources_info += f"URL: {data['url']}\n"
-                combined_sources_info += f"Content: {data['content'][:excerpt_length]}...\n\n"
+                source_parts.append(f"Source {idx}: {data['title']}\n"
+                                    f"URL: {data['url']}\n"
+                                    f"Content: {data['content'][:excerpt_length]}...\n\n")
+            combined_sources_info = "".join(source_parts)
             
             # Create the appropriate template based on format and mode
             if snippet:
@@ -760,11 +764,12 @@ Every single piece of content must be enclosed in appropriate HTML tags. Do not
                 chunk_end = min(chunk_start + chunk_size, len(all_extracted_data))
                 chunk_data = all_extracted_data[chunk_start:chunk_end]
                 
-                sources_info = ""
-                for idx, data in enumerate(chunk_data, chunk_start + 1):
-                    sources_info += f"Source {idx}: {data['title']}\n"
-                    sources_info += f"URL: {data['url']}\n"
-                    sources_info += f"Content: {data['content'][:5000]}...\n\n"
+                sources_info = "".join(
+                    f"Source {idx}: {data['title']}\n"
+                    f"URL: {data['url']}\n"
+                    f"Content: {data['content'][:5000]}...\n\n"
+                    for idx, data in enumerate(chunk_data, chunk_start + 1)
+                )
                 
                 # Create prompt for document generation specific to this chunk
                 if format == 'markdown':
@@ -1027,17 +1032,16 @@ Every single piece of content must be enclosed in appropriate HTML tags. Do not
                         
                         response = response.replace(placeholder, img_content)
             
-            # Add credits at the end of the document
+            # Add credits at the end of the document. The section is built on
+            # its own and appended once, instead of recopying the whole
+            # document for every credit line.
             if image_data["credits"]:
                 if format == 'markdown':
-                    response += "\n\n---\n\n## Image Credits\n\n"
-                    for credit in image_data["credits"]:
-                        response += f"* {credit}\n"
+                    credit_lines = "".join(f"* {credit}\n" for credit in image_data["credits"])
+                    response += f"\n\n---\n\n## Image Credits\n\n{credit_lines}"
                 else:  # HTML
-                    response += "\n\n<hr>\n<h2>Image Credits</h2>\n<ul>\n"
-                    for credit in image_data["credits"]:
-                        response += f"<li>{credit}</li>\n"
-                    response += "</ul>\n"
+                    credit_lines = "".join(f"<li>{credit}</li>\n" for credit in image_data["credits"])
+                    response += f"\n\n<hr>\n<h2>Image Credits</h2>\n<ul>\n{credit_lines}</ul>\n"
         
         # Determine what to do with the response based on write flag
         if write:
@@ -1076,7 +1080,7 @@ Every single piece of content must be enclosed in appropriate HTML tags. Do not
                     file_path = str(output_dir / unique_filename)
             
             # Ensure HTML has proper structure
-            if format == 'html' and not response.strip().startswith('<!DOCTYPE html>'):
+            if format == 'html' and not _DOCTYPE_RE.match(response):
                 response = f"""<!DOCTYPE html>
 <html>
 <head>
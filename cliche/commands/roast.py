@@ -4,15 +4,22 @@ Roast command for generating snarky roasts
 Generate a snarky, witty roast. Because sometimes you just need to be taken down a notch.
 """
 import asyncio
+import random
 import click
 from ..core import cli, CLIche
-from ..prompts import ROAST_PROMPT
+from ..prompts import ROAST_PROMPT, ROAST_EXAMPLES
 
 @cli.command()
-def roastme():
+@click.option('--llm/--local', default=False, help='Ask the LLM for a fresh roast instead of picking a built-in one')
+def roastme(llm: bool):
     """Get a snarky roast. Because sometimes you just need to be taken down a notch."""
+    if not llm:
+        # Built-in roasts need no provider, network round-trip or tokens
+        click.echo(f" '{random.choice(ROAST_EXAMPLES)}'")
+        return
+
     assistant = CLIche()
-    response = asyncio.run(assistant.ask_llm(ROAST_PROMPT))
+    response = asyncio.run(assistant.ask_llm(ROAST_PROMPT, use_cache=False))  # Every roast should be fresh
     # Clean up the response
     response = response.strip().strip('"')  # Remove double quotes
     if not response.startswith("'"):
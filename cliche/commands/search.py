@@ -6,7 +6,7 @@ import os
 import subprocess
 import fnmatch
 from typing import Optional, List, Tuple
-import platform
+from ..utils.sysinfo import OS_NAME
 
 def get_file_size_str(size: int) -> str:
     """Convert file size to human readable string."""
@@ -122,12 +122,12 @@ def search(name: Optional[str], filetype: Optional[str], path: str | None, hidde
         if not success:
             if "fd command not found" in error:
                 click.echo("Note: For faster searches, install fd-find:")
-                if platform.system() == "Linux":
+                if OS_NAME == "Linux":
                     click.echo("  Ubuntu/Debian: sudo apt install fd-find")
                     click.echo("  Arch Linux: sudo pacman -S fd")
-                elif platform.system() == "Darwin":
+                elif OS_NAME == "Darwin":
                     click.echo("  macOS: brew install fd")
-                elif platform.system() == "Windows":
+                elif OS_NAME == "Windows":
                     click.echo("  Windows (scoop): scoop install fd")
                     click.echo("  Windows (choco): choco install fd")
                 click.echo("\nFalling back to find command...\n")
@@ -3,10 +3,13 @@ Server management commands
 """
 import click
 import psutil
+import functools
 import json
-import socket
+import os
+import re
 import shutil
-from typing import Dict, List, Optional, Tuple
+import signal
+from typing import Dict, List, Optional, Set, Tuple
 from ..utils.docker import get_docker_containers
 
 def get_service_default_ports() -> Dict[str, int]:
@@ -48,187 +51,224 @@ def get_service_default_ports() -> Dict[str, int]:
         'unknown-server': 8080
     }
 
+# Ports in LISTEN state, snapshotted once per server scan
+_USED_PORTS: Optional[Set[int]] = None
+
+# Privileged ports that still belong to user-facing servers
+_ALLOWED_SYSTEM_PORTS = frozenset({80, 443})  # HTTP/HTTPS
+
+_SYSTEM_PROCESS_RE = re.compile('|'.join([
+    'blueman',
+    'mintreport',
+    'gnome',
+    'kde',
+    'xfce',
+    'systemd',
+    'dbus',
+    'pulseaudio',
+    'networkmanager',
+    'windsurf',  # Filter out IDE processes
+    'language_server',
+    'utility'
+]))
+
+def _compute_used_ports() -> Set[int]:
+    """Collect every port that currently has a listening socket."""
+    return {conn.laddr.port for conn in psutil.net_connections(kind='inet') if conn.status == 'LISTEN'}
+
 def is_port_available(port: int) -> bool:
     """Check if a port is likely being used by a service."""
-    try:
-        sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-        sock.bind(('localhost', port))
-        sock.close()
-        return True
-    except socket.error:
-        return False
+    global _USED_PORTS
+    if _USED_PORTS is None:
+        _USED_PORTS = _compute_used_ports()
+    return port not in _USED_PORTS
 
 def is_system_port(port: int) -> bool:
     """Check if a port is likely a system port we want to filter out."""
-    return port < 1024 and port not in [80, 443]  # Allow HTTP/HTTPS ports
+    return port < 1024 and port not in _ALLOWED_SYSTEM_PORTS
 
 def is_system_process(name: str, cmdline: List[str]) -> bool:
     """Check if a process is likely a system service we want to filter out."""
-    cmd_str = ' '.join(cmdline).lower()
-    return any(x in cmd_str for x in [
-        'blueman',
-        'mintreport',
-        'gnome',
-        'kde',
-        'xfce',
-        'systemd',
-        'dbus',
-        'pulseaudio',
-        'networkmanager',
-        'windsurf',  # Filter out IDE processes
-        'language_server',
-        'utility'
-    ])
+    return _SYSTEM_PROCESS_RE.search(' '.join(cmdline).lower()) is not None
 
 def get_short_command(cmdline: List[str]) -> str:
     """Get a simplified version of the command."""
     return ' '.join(cmdline[:2]) if len(cmdline) > 2 else ' '.join(cmdline)
 
+def _compile_patterns(patterns: Dict[str, str]) -> Tuple[re.Pattern, Dict[str, str]]:
+    """Compile a pattern -> server type table into a single regex alternation."""
+    return re.compile('|'.join(map(re.escape, patterns))), patterns
+
+# Pattern tables are built once at import time. Within a table patterns are
+# listed in priority order: when several appear, the first one listed wins.
+_NAME_SERVERS = _compile_patterns({
+    # Web servers and databases, recognised from the process name
+    'nginx': 'nginx',
+    'apache': 'apache',
+    'httpd': 'apache',
+    'postgres': 'postgresql',
+    'mysql': 'mysql',
+    'mongod': 'mongodb',
+    'redis': 'redis',
+    'elasticsearch': 'elasticsearch',
+})
+_AI_SERVERS = _compile_patterns({
+    # AI/ML servers, recognised from the process name or command line
+    'ollama': 'ollama',
+    'tensorboard': 'tensorboard',
+    'mlflow': 'mlflow',
+    'gradio': 'gradio',
+    'ray': 'ray',
+})
+_NODE_SERVERS = _compile_patterns({
+    'next': 'next',
+    'nuxt': 'nuxt',
+    'vite': 'vite',
+    'webpack': 'webpack',
+    'react': 'react',
+    'vue': 'vue',
+    'angular': 'angular',
+    'ng serve': 'angular',
+    'server.js': 'nodejs',
+    'app.js': 'nodejs',
+})
+_PYTHON_SERVERS = _compile_patterns({
+    'django': 'django',
+    'flask': 'flask',
+    'streamlit': 'streamlit',
+    'jupyter': 'jupyter',
+})
+_RUBY_SERVERS = _compile_patterns({
+    'rails': 'rails',
+    'puma': 'rails',
+})
+
+def _match_patterns(table: Tuple[re.Pattern, Dict[str, str]], text: str) -> Optional[str]:
+    """Return the server type of the highest priority pattern found in text."""
+    regex, patterns = table
+    found = set(regex.findall(text))
+    if found:
+        for pattern, server_type in patterns.items():
+            if pattern in found:
+                return server_type
+    return None
+
 def detect_server_type(name: str, cmdline: List[str]) -> Optional[str]:
     """Detect the type of server based on process name and command line."""
     cmd_str = ' '.join(cmdline).lower()
     name = name.lower()
     
-    # Web Servers
-    if 'nginx' in name:
-        return 'nginx'
-    elif 'apache' in name or 'httpd' in name:
-        return 'apache'
-    elif 'python' in name and 'http.server' in cmd_str:
+    server_type = _match_patterns(_NAME_SERVERS, name)
+    if server_type:
+        return server_type
+    if 'python' in name and 'http.server' in cmd_str:
         return 'python-http'
         
-    # Databases
-    elif 'postgres' in name:
-        return 'postgresql'
-    elif 'mysql' in name:
-        return 'mysql'
-    elif 'mongodb' in name or 'mongod' in name:
-        return 'mongodb'
-    elif 'redis' in name or 'redis-server' in name:
-        return 'redis'
-    elif 'elasticsearch' in name:
-        return 'elasticsearch'
-        
-    # AI/ML Servers
-    elif 'ollama' in name or 'ollama' in cmd_str:
-        return 'ollama'
-    elif 'tensorboard' in cmd_str:
-        return 'tensorboard'
-    elif 'mlflow' in cmd_str:
-        return 'mlflow'
-    elif 'gradio' in cmd_str:
-        return 'gradio'
-    elif 'ray' in name or 'ray' in cmd_str:
-        return 'ray'
+    server_type = _match_patterns(_AI_SERVERS, f"{name} {cmd_str}")
+    if server_type:
+        return server_type
         
-    # Application Servers
-    elif 'node' in name or 'npm' in cmd_str:
-        if 'next' in cmd_str:
-            return 'next'
-        elif 'nuxt' in cmd_str:
-            return 'nuxt'
-        elif 'vite' in cmd_str:
-            return 'vite'
-        elif 'webpack' in cmd_str:
-            return 'webpack'
-        elif 'react' in cmd_str:
-            return 'react'
-        elif 'vue' in cmd_str:
-            return 'vue'
-        elif 'angular' in cmd_str or 'ng serve' in cmd_str:
-            return 'angular'
-        elif 'server.js' in cmd_str or 'app.js' in cmd_str:
-            return 'nodejs'
-            
-    elif 'python' in name:
-        if 'django' in cmd_str:
-            return 'django'
-        elif 'flask' in cmd_str:
-            return 'flask'
-        elif 'streamlit' in cmd_str:
-            return 'streamlit'
-        elif 'jupyter' in cmd_str:
-            return 'jupyter'
-            
-    elif 'ruby' in name and ('rails' in cmd_str or 'puma' in cmd_str):
-        return 'rails'
+    # Application servers, recognised from the runtime and its command line
+    if 'node' in name or 'npm' in cmd_str:
+        return _match_patterns(_NODE_SERVERS, cmd_str)
+    if 'python' in name:
+        return _match_patterns(_PYTHON_SERVERS, cmd_str)
+    if 'ruby' in name:
+        return _match_patterns(_RUBY_SERVERS, cmd_str)
             
     return None
 
+@functools.lru_cache(maxsize=4096)
+def _proc_identity(pid: int, create_time: float) -> Tuple[Optional[str], Optional[Tuple[str, ...]]]:
+    """Read a process's name and command line.
+    
+    (pid, create_time) identifies a process even after its PID is reused, so
+    repeated scans only read /proc/<pid> for processes they haven't seen.
+    """
+    try:
+        proc = psutil.Process(pid)
+        with proc.oneshot():
+            return proc.name(), tuple(proc.cmdline())
+    except (psutil.NoSuchProcess, psutil.AccessDenied, psutil.ZombieProcess):
+        return None, None
+
 def get_all_servers() -> List[Dict]:
     """Get all running server processes regardless of open ports."""
+    global _USED_PORTS
     servers = []
     default_ports = get_service_default_ports()
     
-    # First, let's get all processes listening on any port
+    # First, let's get all processes listening on any port. The same pass
+    # snapshots every port in use for is_port_available()
     listening_processes = {}  # pid -> ports
+    active_ports = set()
     for conn in psutil.net_connections(kind='inet'):
         try:
-            if conn.status == 'LISTEN' and not is_system_port(conn.laddr.port):
+            if conn.status != 'LISTEN':
+                continue
+            active_ports.add(conn.laddr.port)
+            if not is_system_port(conn.laddr.port):
                 if conn.pid not in listening_processes:
                     listening_processes[conn.pid] = set()
                 listening_processes[conn.pid].add(conn.laddr.port)
         except (psutil.NoSuchProcess, psutil.AccessDenied):
             continue
+    _USED_PORTS = active_ports
+    
+    # Read every process's name and command line in a single pass; both loops
+    # below look processes up here instead of opening /proc/<pid> again
+    proc_info = {}  # pid -> (name, cmdline)
+    for proc in psutil.process_iter(attrs=['pid', 'create_time']):
+        info = proc.info
+        if info['create_time'] is None:
+            continue
+        proc_info[info['pid']] = _proc_identity(info['pid'], info['create_time'])
     
     # Now get process details for all listening processes
     for pid, ports in listening_processes.items():
-        try:
-            proc = psutil.Process(pid)
-            name = proc.name()
-            cmdline = proc.cmdline()
-            if not cmdline or is_system_process(name, cmdline):
-                continue
+        name, cmdline = proc_info.get(pid, (None, None))
+        if not name or not cmdline or is_system_process(name, cmdline):
+            continue
+            
+        server_type = detect_server_type(name, cmdline)
+        if not server_type:
+            # If we can't detect the type but it's listening, mark it as a generic server
+            if any('server' in arg.lower() for arg in cmdline):
+                server_type = 'generic-server'
+            elif any('dev' in arg.lower() for arg in cmdline):
+                server_type = 'dev-server'
+            else:
+                server_type = 'unknown-server'
                 
-            server_type = detect_server_type(name, cmdline)
-            if not server_type:
-                # If we can't detect the type but it's listening, mark it as a generic server
-                if any('server' in arg.lower() for arg in cmdline):
-                    server_type = 'generic-server'
-                elif any('dev' in arg.lower() for arg in cmdline):
-                    server_type = 'dev-server'
-                else:
-                    server_type = 'unknown-server'
-                    
+        servers.append({
+            'pid': pid,
+            'name': name,
+            'type': server_type,
+            'ports': sorted(ports),
+            'command': get_short_command(cmdline)
+        })
+            
+    # Also check for known server types that might not be listening yet
+    for pid, (name, cmdline) in proc_info.items():
+        if not name or not cmdline or pid in listening_processes or is_system_process(name, cmdline):
+            continue
+            
+        server_type = detect_server_type(name, cmdline)
+        
+        if server_type:
+            ports = []
+            # Check default port for this server type
+            default_port = default_ports.get(server_type)
+            if default_port and not is_port_available(default_port):
+                ports.append(default_port)
+            
             servers.append({
                 'pid': pid,
                 'name': name,
                 'type': server_type,
-                'ports': sorted(ports),
+                'ports': sorted(ports) if ports else [],
                 'command': get_short_command(cmdline)
             })
-                    
-        except (psutil.NoSuchProcess, psutil.AccessDenied, psutil.ZombieProcess):
-            continue
-            
-    # Also check for known server types that might not be listening yet
-    for proc in psutil.process_iter(['pid', 'name', 'cmdline']):
-        try:
-            info = proc.info
-            if not info['cmdline'] or info['pid'] in listening_processes or is_system_process(info['name'], info['cmdline']):
-                continue
-                
-            name = info['name']
-            cmdline = info['cmdline']
-            server_type = detect_server_type(name, cmdline)
-            
-            if server_type:
-                ports = []
-                # Check default port for this server type
-                default_port = default_ports.get(server_type)
-                if default_port and not is_port_available(default_port):
-                    ports.append(default_port)
-                
-                servers.append({
-                    'pid': info['pid'],
-                    'name': name,
-                    'type': server_type,
-                    'ports': sorted(ports) if ports else [],
-                    'command': get_short_command(cmdline)
-                })
-                    
-        except (psutil.NoSuchProcess, psutil.AccessDenied, psutil.ZombieProcess):
-            continue
             
     return servers
 
@@ -271,9 +311,11 @@ def servers(action: str, name: Optional[str]):
             
         try:
             pid = int(name)
-            process = psutil.Process(pid)
-            process.terminate()
+            # Signal directly rather than building a psutil.Process just to terminate it
+            os.kill(pid, signal.SIGTERM)
             click.echo(f"Server with PID {pid} has been stopped")
+        except (ProcessLookupError, PermissionError):
+            click.echo(f"Failed to stop server with PID {name}")
         except ValueError:
             # Name is not a PID, try to find by server type
             servers = get_all_servers()
@@ -285,8 +327,7 @@ def servers(action: str, name: Optional[str]):
                 
             for server in matching_servers:
                 try:
-                    process = psutil.Process(server['pid'])
-                    process.terminate()
+                    os.kill(server['pid'], signal.SIGTERM)
                     click.echo(f"Server {name} (PID: {server['pid']}) has been stopped")
-                except (psutil.NoSuchProcess, psutil.AccessDenied):
+                except (ProcessLookupError, PermissionError):
                     click.echo(f"Failed to stop server {name} (PID: {server['pid']})")
@@ -3,35 +3,41 @@ System-related commands
 """
 import click
 import psutil
-import platform
-from datetime import datetime
+import time
 from ..utils.gpu import get_gpu_info
 from ..utils.docker import get_docker_containers
+from ..utils.sysinfo import OS_STRING, cpu_percent
 
 @click.command()
 def system():
     """Display system information"""
     cpu_count = psutil.cpu_count()
-    cpu_usage = psutil.cpu_percent(interval=1)
+    # The counter is primed at import, so this covers the time since startup
+    # (topped up to 100ms) instead of blocking for a full second
+    cpu_usage = cpu_percent(min_window=0.1)
     memory = psutil.virtual_memory()
     disk = psutil.disk_usage('/')
     gpu_name, gpu_usage = get_gpu_info()
     
-    click.echo("\n🖥️  System Information:")
-    click.echo(f"OS: {platform.system()} {platform.release()}")
-    click.echo(f"CPU Cores: {cpu_count}")
-    click.echo(f"CPU Usage: {cpu_usage}%")
-    click.echo(f"Memory: {memory.used/1024/1024/1024:.1f}GB used of {memory.total/1024/1024/1024:.1f}GB ({memory.percent}%)")
-    click.echo(f"Disk: {disk.used/1024/1024/1024:.1f}GB used of {disk.total/1024/1024/1024:.1f}GB ({disk.percent}%)")
+    # Collect the report and print it in one write rather than one per line
+    lines = [
+        "\n🖥️  System Information:",
+        f"OS: {OS_STRING}",
+        f"CPU Cores: {cpu_count}",
+        f"CPU Usage: {cpu_usage}%",
+        f"Memory: {memory.used/1024/1024/1024:.1f}GB used of {memory.total/1024/1024/1024:.1f}GB ({memory.percent}%)",
+        f"Disk: {disk.used/1024/1024/1024:.1f}GB used of {disk.total/1024/1024/1024:.1f}GB ({disk.percent}%)",
+    ]
     
     if gpu_name != "No GPU detected":
-        click.echo(f"GPU: {gpu_name}")
-        click.echo(f"GPU Usage: {gpu_usage}")
+        lines.append(f"GPU: {gpu_name}")
+        lines.append(f"GPU Usage: {gpu_usage}")
         
     docker_containers = get_docker_containers()
     if docker_containers:
-        click.echo("\n🐳 Docker Containers:")
+        lines.append("\n🐳 Docker Containers:")
         for container in docker_containers.values():
-            click.echo(f"- {container['name']} ({container['status']})")
+            lines.append(f"- {container['name']} ({container['status']})")
             
-    click.echo(f"\nCurrent Time: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
+    lines.append(f"\nCurrent Time: {time.strftime('%Y-%m-%d %H:%M:%S')}")
+    click.echo("\n".join(lines))
@@ -16,6 +16,21 @@ import re  # Add this import at the top if it's not already there
 # Initialize console for rich output
 console = Console()
 
+# Output format -> (file extension, LLM formatting instructions)
+_FORMATS = {
+    'text': ('.txt', 'Write this as a plain text document without any special formatting.'),
+    'markdown': ('.md', 'Write this as a markdown document with proper formatting. Use markdown features like headings, lists, code blocks, bold, italic, and links as appropriate.'),
+    'html': ('.html', 'Write this as an HTML document with proper tags and structure.')
+}
+
+# Placeholder instructions appended when images are requested; IMAGE_N tokens
+# are swapped for the real images after generation
+_IMAGE_INSTRUCTIONS_TEMPLATE = (
+    "\n\nInclude {n} image placeholder(s) at the most relevant points in the document. "
+    "Put each placeholder on its own line: IMAGE_1 for the first image, IMAGE_2 for the second, and so on. "
+    "Write the placeholders as bare words, not inside markdown image syntax or HTML tags."
+)
+
 @cli.command()
 @click.argument('prompt', nargs=-1, required=True)
 @click.option('--format', '-f', type=click.Choice(['text', 'markdown', 'html']), default='text',
@@ -45,13 +60,8 @@ async def async_write(prompt: tuple[str, ...], format: str, path: Optional[str],
     # Join the prompt parts
     full_prompt = ' '.join(prompt)
     
-    # Get format-specific extension
-    if format == 'markdown':
-        ext = '.md'
-    elif format == 'html':
-        ext = '.html'
-    else:
-        ext = f'.{format}'
+    # Get format-specific extension and instructions
+    ext, format_instructions = _FORMATS[format]
     
     # Get default filename if path not provided
     if not path:
@@ -64,8 +74,10 @@ async def async_write(prompt: tuple[str, ...], format: str, path: Optional[str],
         unique_filename = get_unique_filename(output_dir, base_filename)
         path = str(output_dir / unique_filename)
     
-    # Initialize image data dictionary
-    image_data = {"images": [], "credits": []}
+    # Image data kept as parallel lists, one entry per fetched image
+    image_urls: list[str] = []
+    image_alts: list[str] = []
+    image_credits: list[str] = []
     
     # Fetch images if requested
     if image or image_id:
@@ -75,58 +87,51 @@ async def async_write(prompt: tuple[str, ...], format: str, path: Optional[str],
             if image_id:
                 # Get a specific image by ID
                 console.print(f"🖼️ Getting image with ID: {image_id}...")
-                photo_data = unsplash.get_photo_url(image_id, width=image_width)
+                photo_data = await unsplash.get_photo_url_async(image_id, width=image_width)
                 if photo_data:
                     # Add to image data
-                    image_data["images"].append({
-                        "url": photo_data["url"],
-                        "alt_text": photo_data["alt_text"],
-                        "width": image_width
-                    })
-                    image_data["credits"].append(get_photo_credit(photo_data, format))
+                    image_urls.append(photo_data["url"])
+                    image_alts.append(photo_data["alt_text"])
+                    image_credits.append(get_photo_credit(photo_data, format))
             
             elif image:
                 # Search for images by term
                 console.print(f"🔍 Searching for '{image}' images...")
-                results = unsplash.search_photos(image, per_page=image_count)
+                results = await unsplash.search_photos_async(image, per_page=image_count)
                 
                 # Check if we have results
-                photos = results.get('results', [])
+                photos = results.get('results', [])[:image_count]
                 if not photos:
                     console.print("❌ No images found for this search term.")
                 else:
-                    # Get image data for each photo in results
-                    for i, photo in enumerate(photos[:image_count]):
-                        photo_id = photo.get('id')
-                        console.print(f"🖼️ Getting image {i+1}/{min(image_count, len(photos))}...")
+                    # Fetch all photos concurrently over the shared connection pool
+                    console.print(f"🖼️ Getting {len(photos)} image(s)...")
+                    fetched = await asyncio.gather(
+                        *(unsplash.get_photo_url_async(photo.get('id'), width=image_width) for photo in photos),
+                        return_exceptions=True
+                    )
+                    
+                    for photo, photo_data in zip(photos, fetched):
+                        if isinstance(photo_data, Exception):
+                            console.print(f"⚠️ Error getting image: {str(photo_data)}")
+                            continue
                         
-                        try:
-                            photo_data = unsplash.get_photo_url(photo_id, width=image_width)
-                            
-                            # Add to image data
-                            image_data["images"].append({
-                                "url": photo_data["url"],
-                                "alt_text": photo_data["alt_text"],
-                                "width": image_width
-                            })
-                            image_data["credits"].append(get_photo_credit(photo, format))
-                            
-                        except Exception as e:
-                            console.print(f"⚠️ Error getting image: {str(e)}")
+                        # Add to image data
+                        image_urls.append(photo_data["url"])
+                        image_alts.append(photo_data["alt_text"])
+                        image_credits.append(get_photo_credit(photo, format))
             
         except Exception as e:
             console.print(f"⚠️ Error fetching images: {str(e)}")
             console.print("Continuing without images...")
     
     # Add format-specific instructions
-    format_instructions = {
-        'text': 'Write this as a plain text document without any special formatting.',
-        'markdown': 'Write this as a markdown document with proper formatting. Use markdown features like headings, lists, code blocks, bold, italic, and links as appropriate.',
-        'html': 'Write this as an HTML document with proper tags and structure.'
-    }[format]
-    
     full_prompt = f"{format_instructions}\n\n{full_prompt}"
     
+    # Ask for numbered placeholders so images land where the LLM thinks they fit
+    if image_urls and format in ('markdown', 'html'):
+        full_prompt += _IMAGE_INSTRUCTIONS_TEMPLATE.format(n=len(image_urls))
+    
     # Get the LLM instance
     llm = get_llm()
     
@@ -156,7 +161,7 @@ async def async_write(prompt: tuple[str, ...], format: str, path: Optional[str],
         content = re.sub(r'\[INSERT_IMAGE_\d+_HERE\]', '', content)
         
         # Process images if we have any
-        if image_data["images"] and (format == 'markdown' or format == 'html'):
+        if image_urls and (format == 'markdown' or format == 'html'):
             # Check if any IMAGE_ placeholders are in the document
             placeholders_found = len(re.findall(r'\bIMAGE_\d+\b', content))
             
@@ -173,7 +178,7 @@ async def async_write(prompt: tuple[str, ...], format: str, path: Optional[str],
                     insertion_points = await get_image_placement_suggestions(
                         llm=llm, 
                         document_content=content, 
-                        image_count=len(image_data["images"]),
+                        image_count=len(image_urls),
                         topic=full_prompt[:50],
                         format=format
                     )
@@ -187,14 +192,14 @@ async def async_write(prompt: tuple[str, ...], format: str, path: Optional[str],
                     heading_indices = [i for i, p in enumerate(paragraphs) if p.startswith('#')]
                     
                     # If we have enough headings, distribute images after headings
-                    if len(heading_indices) >= len(image_data["images"]):
+                    if len(heading_indices) >= len(image_urls):
                         # Choose evenly spaced heading indices
-                        step = len(heading_indices) // (len(image_data["images"]) + 1)
+                        step = len(heading_indices) // (len(image_urls) + 1)
                         if step < 1:
                             step = 1
                         
                         insertion_points = []
-                        for i in range(1, len(image_data["images"]) + 1):
+                        for i in range(1, len(image_urls) + 1):
                             idx = min(i * step, len(heading_indices) - 1)
                             heading_idx = heading_indices[idx]
                             insertion_point = min(heading_idx + 1, len(paragraphs) - 1)
@@ -203,13 +208,13 @@ async def async_write(prompt: tuple[str, ...], format: str, path: Optional[str],
                     else:
                         # Not enough headings, distribute evenly throughout document
                         total_paragraphs = len(paragraphs)
-                        spacing = total_paragraphs // (len(image_data["images"]) + 1)
+                        spacing = total_paragraphs // (len(image_urls) + 1)
                         
                         # Ensure we don't insert at the beginning
                         start_point = min(4, total_paragraphs // 10)
                         
                         insertion_points = []
-                        for i in range(len(image_data["images"])):
+                        for i in range(len(image_urls)):
                             # Calculate position ensuring even distribution
                             pos = start_point + (i + 1) * spacing
                             pos = min(pos, total_paragraphs - 1)
@@ -226,18 +231,18 @@ async def async_write(prompt: tuple[str, ...], format: str, path: Optional[str],
                     insertion_points.sort()
                     
                     # Make sure we don't have more insertion points than images
-                    insertion_points = insertion_points[:len(image_data["images"])]
+                    insertion_points = insertion_points[:len(image_urls)]
                     
                     # Insert images at the chosen points
                     for i, insertion_idx in enumerate(insertion_points):
-                        if i < len(image_data["images"]):
-                            img_data = image_data["images"][i]
-                            img_alt = img_data["alt_text"] or "Image"
+                        if i < len(image_urls):
+                            img_url = image_urls[i]
+                            img_alt = image_alts[i] or "Image"
                             
                             if format == 'markdown':
-                                img_content = f"\n\n![{img_alt}]({img_data['url']})\n\n"
+                                img_content = f"\n\n![{img_alt}]({img_url})\n\n"
                             else:  # HTML format
-                                img_content = f"\n\n<img src=\"{img_data['url']}\" alt=\"{img_alt}\" style=\"max-width: 100%; height: auto;\">\n\n"
+                                img_content = f"\n\n<img src=\"{img_url}\" alt=\"{img_alt}\" style=\"max-width: 100%; height: auto;\">\n\n"
                                 
                             paragraphs.insert(insertion_idx + i, img_content)
                     
@@ -248,31 +253,31 @@ async def async_write(prompt: tuple[str, ...], format: str, path: Optional[str],
                 console.print(f"🔄 Processing {placeholders_found} image placeholders...")
                 
                 # Replace placeholders with actual images
-                for i, img_data in enumerate(image_data["images"]):
+                for i, (img_url, img_alt) in enumerate(zip(image_urls, image_alts)):
                     img_idx = i + 1
                     if img_idx <= placeholders_found:
                         placeholder = f"IMAGE_{img_idx}"
                         if format == 'markdown':
-                            img_content = f"![{img_data['alt_text'] or 'Image'}]({img_data['url']})"
+                            img_content = f"![{img_alt or 'Image'}]({img_url})"
                         else:  # HTML
-                            img_content = f"<img src=\"{img_data['url']}\" alt=\"{img_data['alt_text'] or 'Image'}\" style=\"max-width: 100%; height: auto;\">"
+                            img_content = f"<img src=\"{img_url}\" alt=\"{img_alt or 'Image'}\" style=\"max-width: 100%; height: auto;\">"
                         
                         content = content.replace(placeholder, img_content)
             
             # Add credits at the end of the document if we processed any images
-            if image_data["credits"]:
+            if image_credits:
                 if format == 'markdown':
                     content += "\n\n---\n\n## Image Credits\n\n"
-                    for credit in image_data["credits"]:
+                    for credit in image_credits:
                         content += f"* {credit}\n"
                 else:  # HTML
                     content += "\n\n<hr>\n<h2>Image Credits</h2>\n<ul>\n"
-                    for credit in image_data["credits"]:
+                    for credit in image_credits:
                         content += f"<li>{credit}</li>\n"
                     content += "</ul>\n"
         
-        # Save to file
-        save_text_to_file(content, path)
+        # Save to file off the event loop so large documents don't stall it
+        await asyncio.to_thread(save_text_to_file, content, path)
         console.print(f"✅ Content saved to: {path}")
         return
         
@@ -2,62 +2,82 @@
 Core functionality for CLIche
 """
 import os
+import copy
 import json
+import re
+import asyncio
 import click
 from pathlib import Path
-from enum import Enum
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, List, AsyncIterator
 import logging
 
-from .providers import get_provider_class
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
+from .providers import LLMProvider, get_provider_class
 from .providers.base import LLMBase
-from .providers.openai import OpenAIProvider
-from .providers.anthropic import AnthropicProvider
-from .providers.google import GoogleProvider
-from .providers.ollama import OllamaProvider
-from .providers.deepseek import DeepSeekProvider
-from .providers.openrouter import OpenRouterProvider
+from .cache import ResponseCache, make_cache_key
 from .utils.generate_from_scrape import generate
 
+# Resolved once at import; the home directory doesn't move while we run
+CONFIG_DIR = Path.home() / ".config" / "cliche"
+CONFIG_FILE = CONFIG_DIR / "config.json"
+
+# Written out on first run; deep-copied since callers mutate the loaded config
+_DEFAULT_CONFIG = {
+    "provider": "openai",
+    "providers": {
+        "openai": {"api_key": "", "model": "gpt-4"},
+        "anthropic": {"api_key": "", "model": "claude-3-opus-20240229"},
+        "google": {"api_key": "", "model": "gemini-pro"},
+        "ollama": {"model": "phi4"},
+        "deepseek": {"api_key": "", "model": "deepseek-chat"},
+        "openrouter": {"api_key": "", "model": "gpt-4-turbo-preview"}
+    },
+    "services": {
+        "unsplash": {"api_key": ""},
+        "stability_ai": {"api_key": ""},
+        "dalle": {"use_openai_key": False},
+        "brave_search": {"api_key": ""}
+    },
+    "image_generation": {
+        "default_provider": "dalle",  # Options: dalle, stability
+        "default_size": "1024x1024",
+        "default_quality": "standard"  # Options: standard, hd
+    }
+}
+
 class Config:
+    __slots__ = ("config_dir", "config_file", "_saved_config", "config")
+
     def __init__(self):
-        self.config_dir = Path.home() / ".config" / "cliche"
-        self.config_file = self.config_dir / "config.json"
+        self.config_dir = CONFIG_DIR
+        self.config_file = CONFIG_FILE
+        # What the file on disk holds, so unchanged configs aren't rewritten
+        self._saved_config = None
         self.config = self._load_config()
         self._load_services_env()
 
     def _load_config(self) -> Dict[str, Any]:
         """Load configuration from file."""
-        if not self.config_file.exists():
+        try:
+            with open(self.config_file, "rb") as f:
+                data = f.read()
+        except FileNotFoundError:
             # Create default config
-            default_config = {
-                "provider": "openai",
-                "providers": {
-                    "openai": {"api_key": "", "model": "gpt-4"},
-                    "anthropic": {"api_key": "", "model": "claude-3-opus-20240229"},
-                    "google": {"api_key": "", "model": "gemini-pro"},
-                    "ollama": {"model": "phi4"},
-                    "deepseek": {"api_key": "", "model": "deepseek-chat"},
-                    "openrouter": {"api_key": "", "model": "gpt-4-turbo-preview"}
-                },
-                "services": {
-                    "unsplash": {"api_key": ""},
-                    "stability_ai": {"api_key": ""},
-                    "dalle": {"use_openai_key": False},
-                    "brave_search": {"api_key": ""}
-                },
-                "image_generation": {
-                    "default_provider": "dalle",  # Options: dalle, stability
-                    "default_size": "1024x1024",
-                    "default_quality": "standard"  # Options: standard, hd
-                }
-            }
+            default_config = copy.deepcopy(_DEFAULT_CONFIG)
             self.save_config(default_config)
             return default_config
 
+        loads = orjson.loads if HAS_ORJSON else json.loads
         try:
-            with open(self.config_file, "r") as f:
-                return json.load(f)
+            # Callers mutate the config before saving, so the saved snapshot
+            # is a second parse; re-parsing is cheaper than a deepcopy
+            self._saved_config = loads(data)
+            return loads(data)
         except json.JSONDecodeError:
             click.echo("Error reading config file. Using defaults.")
             return {"provider": "openai", "providers": {}, "services": {}}
@@ -88,13 +108,29 @@ class Config:
 
     def save_config(self, config: Dict[str, Any]) -> None:
         """Save configuration to file."""
+        if config == self._saved_config:
+            # Nothing changed since the file was read or last written
+            self.config = config
+            self._load_services_env()
+            return
+
         # Create config directory if it doesn't exist
         self.config_dir.mkdir(parents=True, exist_ok=True)
         
-        # Write config file
-        with open(self.config_file, "w") as f:
-            json.dump(config, f, indent=4)
-        
+        # Serialize in one go so the file is written with a single call;
+        # orjson's bytes go straight to disk without a decode/encode round trip
+        if HAS_ORJSON:
+            data = orjson.dumps(config, option=orjson.OPT_INDENT_2)
+        else:
+            data = json.dumps(config, indent=4).encode()
+
+        # Write to a temp file and swap it in so a crash never leaves a truncated config
+        tmp_file = self.config_file.with_suffix(".json.tmp")
+        with open(tmp_file, "wb") as f:
+            f.write(data)
+        os.replace(tmp_file, self.config_file)
+        self._saved_config = copy.deepcopy(config)
+
         self.config = config
         # Reload service API keys
         self._load_services_env()
@@ -103,58 +139,145 @@ class Config:
         """Get configuration for a specific provider."""
         return self.config.get("providers", {}).get(provider_name, {})
 
-class LLMProvider(str, Enum):
-    OPENAI = "openai"
-    ANTHROPIC = "anthropic"
-    GOOGLE = "google"
-    OLLAMA = "ollama"
-    DEEPSEEK = "deepseek"
-    OPENROUTER = "openrouter"
+# Providers report failures as "<Provider> Error: ..." strings instead of raising
+_ERROR_RESPONSE_RE = re.compile(r"^(💡 )?(OpenAI|Anthropic|Google|Ollama|DeepSeek|OpenRouter) Error: ")
 
 def get_llm():
     """Get the configured LLM provider."""
-    cliche = CLIche()
-    return cliche.provider
+    return CLIche.get_instance().provider
 
 class CLIche:
+    __slots__ = ("logger", "config", "cache", "provider")
+
+    # Shared instance handed out by get_instance()
+    _instance = None
+
+    @classmethod
+    def get_instance(cls) -> "CLIche":
+        """Get a process-wide CLIche, creating it on first use.
+        
+        Commands that only need the configured provider share this instead of
+        loading the config and building a provider each time.
+        """
+        if cls._instance is None:
+            cls._instance = cls()
+        return cls._instance
+
     def __init__(self, config_path=None):
         """Initialize CLIche with config."""
         self.logger = logging.getLogger(__name__)
         self.config = Config()
+        # Response caching is opt-in: it is only enabled by setting
+        # "response_cache_ttl" (seconds) in the config, and entries always expire
+        cache_ttl = self.config.config.get("response_cache_ttl")
+        self.cache = ResponseCache(ttl=cache_ttl) if cache_ttl and cache_ttl > 0 else None
         
         # Load the provider
         provider_name = self.config.config.get("provider", "ollama")
         
-        # Get the provider class (loaded on demand)
+        try:
+            self.provider = self._get_provider()
+            self.logger.info(f"Initialized provider: {provider_name}")
+        except ValueError as e:
+            self.logger.error(f"Provider {provider_name} not available: {str(e)}")
+            self.provider = None
+        except Exception as e:
+            self.logger.error(f"Failed to initialize provider {provider_name}: {str(e)}")
+            self.provider = None
+
+    def _get_provider(self) -> LLMBase:
+        """Instantiate the provider selected in the current config."""
+        provider_name = self.config.config.get("provider", "ollama")
+        # A single table lookup both validates the name and finds the class
         provider_class = get_provider_class(provider_name)
+        if provider_class is None:
+            raise ValueError(f"Unknown provider: {provider_name}")
         
-        if provider_class:
-            try:
-                self.provider = provider_class(self.config)
-                self.logger.info(f"Initialized provider: {provider_name}")
-            except Exception as e:
-                self.logger.error(f"Failed to initialize provider {provider_name}: {str(e)}")
-                self.provider = None
-        else:
-            self.logger.error(f"Provider {provider_name} not available")
-            self.provider = None
+        provider_config = self.config.get_provider_config(provider_name.lower())
+        return provider_class(provider_config)
 
-    def _should_include_system_info(self, query: str) -> bool:
-        """Determine if system information should be included based on query content."""
-        system_keywords = [
-            "system", "os", "platform", "hardware", "cpu", "memory",
-            "ram", "disk", "storage", "network", "gpu", "processor"
-        ]
-        query_lower = query.lower()
-        return any(keyword in query_lower for keyword in system_keywords)
+    def _cache_key(self, query: str, include_sys_info: bool, professional_mode: bool) -> str:
+        """Get the response cache key for a query to the current provider and model."""
+        provider_name = self.config.config.get("provider", "ollama")
+        model = self.config.get_provider_config(provider_name).get("model")
+        return make_cache_key(provider_name, model, query, include_sys_info, professional_mode)
 
-    def ask_llm(self, query: str):
+    async def ask_llm(self, query: str, use_cache: bool = True,
+                      include_sys_info: bool = False, professional_mode: bool = False) -> str:
         """Ask the LLM a question.
         
         Args:
             query: The question to ask
+            use_cache: Whether to reuse a stored response to the same query
+                (only applies when the response cache is enabled)
+            include_sys_info: Whether to include system information in the context
+            professional_mode: If True, use professional tone without personality traits
         """
-        return self.provider.generate_response(query)
+        if not use_cache or self.cache is None:
+            return await self.provider.generate_response(query, include_sys_info, professional_mode)
+
+        key = self._cache_key(query, include_sys_info, professional_mode)
+        cached = self.cache.get(key)
+        if cached is not None:
+            return cached
+
+        response = await self.provider.generate_response(query, include_sys_info, professional_mode)
+        if response and not _ERROR_RESPONSE_RE.match(response):
+            self.cache.set(key, response)
+        return response
+
+    async def stream_llm(self, query: str, use_cache: bool = True,
+                         include_sys_info: bool = False, professional_mode: bool = False) -> AsyncIterator[str]:
+        """Ask the LLM a question and yield the response as it arrives.
+        
+        Args:
+            query: The question to ask
+            use_cache: Whether to reuse a stored response to the same query
+                (only applies when the response cache is enabled)
+            include_sys_info: Whether to include system information in the context
+            professional_mode: If True, use professional tone without personality traits
+        """
+        if not use_cache or self.cache is None:
+            async for chunk in self.provider.stream_response(query, include_sys_info, professional_mode):
+                yield chunk
+            return
+
+        key = self._cache_key(query, include_sys_info, professional_mode)
+        cached = self.cache.get(key)
+        if cached is not None:
+            yield cached
+            return
+
+        chunks = []
+        async for chunk in self.provider.stream_response(query, include_sys_info, professional_mode):
+            chunks.append(chunk)
+            yield chunk
+        response = "".join(chunks)
+        if response and not _ERROR_RESPONSE_RE.match(response):
+            self.cache.set(key, response)
+
+    async def ask_many(self, queries: List[str], concurrency: int = 8, use_cache: bool = True,
+                       include_sys_info: bool = False, professional_mode: bool = False) -> List[str]:
+        """Ask the LLM several questions concurrently.
+        
+        Args:
+            queries: The questions to ask
+            concurrency: Maximum number of requests in flight at once
+            use_cache: Whether to reuse stored responses to the same queries
+            include_sys_info: Whether to include system information in the context
+            professional_mode: If True, use professional tone without personality traits
+        """
+        sem = asyncio.Semaphore(concurrency)
+
+        async def _guarded(query: str) -> str:
+            async with sem:
+                return await self.ask_llm(query, use_cache=use_cache, include_sys_info=include_sys_info,
+                                          professional_mode=professional_mode)
+
+        # One failed query shouldn't throw away the answers to the others
+        results = await asyncio.gather(*(_guarded(query) for query in queries), return_exceptions=True)
+        return [f"Error: {str(result)}" if isinstance(result, Exception) else result
+                for result in results]
 
 # Create the main CLI group
 @click.group()
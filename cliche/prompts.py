@@ -77,20 +77,27 @@ PROFESSIONAL_SYSTEM_PROMPT = '''You are CLIche, a professional and knowledgeable
 
 You focus solely on delivering high-quality technical content without personality quirks, sarcasm, or unnecessary commentary. Your goal is to produce clean, professional documentation and code that meets the highest standards.'''
 
-ROAST_PROMPT = '''Generate ONE snarky, witty roast. Make it short, clever, and memorable.
+# Example roasts, used both to steer the LLM and for instant local roasts
+ROAST_EXAMPLES = (
+    "You have a face that would make onions cry.",
+    "I look at you and think, Two billion years of evolution, for this?",
+    "I am jealous of all the people that have never met you.",
+    "I consider you my sun. Now please get 93 million miles away from here.",
+    "If laughter is the best medicine, your face must be curing the world.",
+    "You're not simply a drama queen/king. You're the whole royal family.",
+    "I was thinking about you today. It reminded me to take out the trash.",
+    "You are the human version of cramps.",
+    "You haven't changed since the last time I saw you. You really should.",
+    "If ignorance is bliss, you must be the happiest person on Earth.",
+)
+
+_ROAST_EXAMPLES = "\n".join(f"'{roast}'" for roast in ROAST_EXAMPLES)
+
+ROAST_PROMPT = f'''Generate ONE snarky, witty roast. Make it short, clever, and memorable.
 Focus on general personality/life roasts like the examples, not tech-related ones.
 
 Example format (but create a new one):
-'You have a face that would make onions cry.'
-'I look at you and think, Two billion years of evolution, for this?'
-'I am jealous of all the people that have never met you.'
-'I consider you my sun. Now please get 93 million miles away from here.'
-'If laughter is the best medicine, your face must be curing the world.'
-'You're not simply a drama queen/king. You're the whole royal family.'
-'I was thinking about you today. It reminded me to take out the trash.'
-'You are the human version of cramps.'
-'You haven't changed since the last time I saw you. You really should.'
-'If ignorance is bliss, you must be the happiest person on Earth.'
+{_ROAST_EXAMPLES}
 
 Remember:
 - Just ONE roast
@@ -1,14 +1,10 @@
 """
 LLM provider implementations
 """
+import functools
+import importlib
 from enum import Enum
 from .base import LLMBase
-from .openai import OpenAIProvider
-from .anthropic import AnthropicProvider
-from .google import GoogleProvider
-from .ollama import OllamaProvider
-from .deepseek import DeepSeekProvider
-from .openrouter import OpenRouterProvider
 
 class LLMProvider(str, Enum):
     OPENAI = "openai"
@@ -18,25 +14,37 @@ class LLMProvider(str, Enum):
     DEEPSEEK = "deepseek"
     OPENROUTER = "openrouter"
 
+# Provider -> (module, class). Modules are imported on first use, so only the
+# active provider's HTTP stack gets loaded.
+_PROVIDER_CLASSES = {
+    LLMProvider.OPENAI: (".openai", "OpenAIProvider"),
+    LLMProvider.ANTHROPIC: (".anthropic", "AnthropicProvider"),
+    LLMProvider.GOOGLE: (".google", "GoogleProvider"),
+    LLMProvider.OLLAMA: (".ollama", "OllamaProvider"),
+    LLMProvider.DEEPSEEK: (".deepseek", "DeepSeekProvider"),
+    LLMProvider.OPENROUTER: (".openrouter", "OpenRouterProvider"),
+}
+
+def _load_provider_class(provider: LLMProvider):
+    """Import a provider's module and return its class."""
+    module_name, class_name = _PROVIDER_CLASSES[provider]
+    return getattr(importlib.import_module(module_name, __name__), class_name)
+
+@functools.lru_cache(maxsize=None)
 def get_provider_class(provider_name: str):
-    """Get a provider class by name."""
-    provider_name = provider_name.lower()
-    
-    if provider_name == LLMProvider.OPENAI.value:
-        return OpenAIProvider
-    elif provider_name == LLMProvider.ANTHROPIC.value:
-        return AnthropicProvider
-    elif provider_name == LLMProvider.GOOGLE.value:
-        return GoogleProvider
-    elif provider_name == LLMProvider.OLLAMA.value:
-        return OllamaProvider
-    elif provider_name == LLMProvider.DEEPSEEK.value:
-        return DeepSeekProvider
-    elif provider_name == LLMProvider.OPENROUTER.value:
-        return OpenRouterProvider
-    else:
+    """Get a provider class by name. Lookups are memoized; there are only a handful of names."""
+    try:
+        return _load_provider_class(LLMProvider(provider_name.lower()))
+    except ValueError:
         return None
 
+def __getattr__(name: str):
+    """Keep `from cliche.providers import OpenAIProvider` working without eager imports."""
+    for provider, (_, class_name) in _PROVIDER_CLASSES.items():
+        if class_name == name:
+            return _load_provider_class(provider)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 __all__ = [
     'LLMBase', 
     'LLMProvider', 
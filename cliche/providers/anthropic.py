@@ -2,32 +2,79 @@
 Anthropic provider implementation
 """
 import os
-from typing import Dict, List, Tuple
-import anthropic
+from typing import AsyncIterator, Dict, List, Tuple
 from .base import LLMBase
+from ..prompts import MAIN_SYSTEM_PROMPT, PROFESSIONAL_SYSTEM_PROMPT
+from ..utils.http_pool import get_sdk_client
 
 class AnthropicProvider(LLMBase):
+    __slots__ = ("_client_class", "api_key")
+
     def __init__(self, config: Dict):
         super().__init__(config)
-        self.client = anthropic.Anthropic(api_key=config.get('api_key') or os.getenv('ANTHROPIC_API_KEY'))
+        # Imported here so only the active provider's SDK gets loaded
+        from anthropic import AsyncAnthropic
+        self._client_class = AsyncAnthropic
+        self.api_key = config.get('api_key') or os.getenv('ANTHROPIC_API_KEY')
+
+    async def _get_client(self):
+        """Get the process-wide client, which sends requests through the shared connection pool."""
+        return await get_sdk_client(self._client_class, self.api_key)
+
+    def _system_blocks(self, include_sys_info: bool, professional_mode: bool) -> List[Dict]:
+        """Split the system context into a cacheable prompt block and the live details.
+        
+        The personality prompt is identical on every call, so it is marked for
+        prompt caching; the time and system information after it change and
+        would otherwise invalidate the cached prefix.
+        """
+        prompt = PROFESSIONAL_SYSTEM_PROMPT if professional_mode else MAIN_SYSTEM_PROMPT
+        context = self.get_system_context(include_sys_info, professional_mode)
+        return [
+            {"type": "text", "text": prompt, "cache_control": {"type": "ephemeral"}},
+            {"type": "text", "text": context[len(prompt):].lstrip("\n")}
+        ]
 
     async def generate_response(self, query: str, include_sys_info: bool = False, professional_mode: bool = False) -> str:
         try:
             # Get system context
-            system_context = self.get_system_context(include_sys_info, professional_mode)
+            system_context = self._system_blocks(include_sys_info, professional_mode)
             
-            response = self.client.messages.create(
+            client = await self._get_client()
+            response = await client.messages.create(
                 model=self.config['model'],
                 system=system_context,  # Anthropic uses a separate system parameter
                 messages=[
                     {"role": "user", "content": query}
                 ],
-                max_tokens=self.config.get('max_tokens', 1000)  # Use our new default
+                max_tokens=self.config['max_tokens']
             )
             return response.content[0].text
         except Exception as e:
             return f"Anthropic Error: {str(e)}"
 
+    async def stream_response(self, query: str, include_sys_info: bool = False, professional_mode: bool = False) -> AsyncIterator[str]:
+        """Yield response text as Claude generates it."""
+        try:
+            system_context = self._system_blocks(include_sys_info, professional_mode)
+            
+            client = await self._get_client()
+            stream = await client.messages.create(
+                model=self.config['model'],
+                system=system_context,
+                messages=[
+                    {"role": "user", "content": query}
+                ],
+                max_tokens=self.config['max_tokens'],
+                stream=True
+            )
+            # Text arrives in content_block_delta events; the rest are bookkeeping
+            async for event in stream:
+                if event.type == "content_block_delta" and getattr(event.delta, "text", None):
+                    yield event.delta.text
+        except Exception as e:
+            yield f"Anthropic Error: {str(e)}"
+
     async def list_models(self) -> List[Tuple[str, str]]:
         """List available Anthropic models."""
         # Anthropic doesn't have a models list API, so we hardcode the latest models
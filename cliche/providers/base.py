@@ -1,58 +1,103 @@
 """
 Base LLM provider class
 """
-import platform
-import psutil
-from datetime import datetime
-from typing import Dict, Optional, List, Tuple
-from ..utils.gpu import get_gpu_info
+import functools
+import time
+from typing import AsyncIterator, Dict, Optional, List, Tuple
+from ..utils.gpu import get_gpu_name, get_gpu_utilization
+from ..utils.sysinfo import OS_STRING, sample_system
+from ..utils.ttl_cache import ttl_cache
 from ..prompts import MAIN_SYSTEM_PROMPT, PROFESSIONAL_SYSTEM_PROMPT
 
-class LLMBase:
-    def __init__(self, config: Dict):
-        self.config = config
-        # Set default max tokens if not specified
-        if 'max_tokens' not in self.config:
-            self.config['max_tokens'] = 1000  # Increased to allow for longer, more detailed responses
+_SYS_INFO_FOOTER = "\n\nFeel free to reference this system information in your responses when relevant."
 
-    def get_system_context(self, include_sys_info: bool = False, professional_mode: bool = False) -> str:
-        """Get current system context.
-        
-        Args:
-            include_sys_info: Whether to include system information in the context.
-            professional_mode: If True, use professional tone without personality traits.
-        """
-        # Use professional prompt or personality prompt based on mode
-        context = PROFESSIONAL_SYSTEM_PROMPT if professional_mode else MAIN_SYSTEM_PROMPT
+def _escape_braces(text: str) -> str:
+    """Escape text so str.format leaves it alone."""
+    return text.replace("{", "{{").replace("}", "}}")
+
+@functools.lru_cache(maxsize=2)
+def _sys_info_template(professional_mode: bool) -> str:
+    """Get the system information context with only the changing fields left to fill in.
+    
+    The prompt, OS and GPU name are fixed for the life of the process, so
+    they are formatted once per mode and each call is a single format_map().
+    """
+    context = PROFESSIONAL_SYSTEM_PROMPT if professional_mode else MAIN_SYSTEM_PROMPT
+    gpu_name = get_gpu_name()
+    gpu_line = f"\n- GPU: {_escape_braces(gpu_name)} (Usage: {{gpu_usage}})" if gpu_name != "No GPU detected" else ""
+    return (f"{_escape_braces(context)}\n\nCurrent system information:\n"
+            "- Current time: {time}\n"
+            "- Current date: {date}\n"
+            "- CPU Usage: {cpu}%\n"
+            "- Memory Usage: {mem}%\n"
+            f"- OS: {_escape_braces(OS_STRING)}{gpu_line}{_escape_braces(_SYS_INFO_FOOTER)}")
+
+@functools.lru_cache(maxsize=1)
+def _clock_strings(minute: int) -> Tuple[str, str]:
+    """Format the time and date shown to the model for a given minute since the epoch.
+    
+    Both strings only have minute resolution, so they are formatted once per minute.
+    """
+    # One format call for both; neither half can contain the separator
+    current_time, current_date = time.strftime("%I:%M %p|%B %d, %Y", time.localtime(minute * 60)).split("|", 1)
+    return current_time, current_date
 
-        # Add current time and system info if requested
-        current_time = datetime.now().strftime("%I:%M %p")
-        current_date = datetime.now().strftime("%B %d, %Y")
+@ttl_cache(seconds=2)
+def _build_system_context(include_sys_info: bool = False, professional_mode: bool = False) -> str:
+    """Get current system context.
+    
+    The result is reused for a couple of seconds, so back-to-back requests
+    (batches, retries) don't re-sample the system each time.
+    
+    Args:
+        include_sys_info: Whether to include system information in the context.
+        professional_mode: If True, use professional tone without personality traits.
+    """
+    # Use professional prompt or personality prompt based on mode
+    context = PROFESSIONAL_SYSTEM_PROMPT if professional_mode else MAIN_SYSTEM_PROMPT
 
-        if include_sys_info:
-            cpu_usage = psutil.cpu_percent()
-            memory = psutil.virtual_memory().percent
-            gpu_name, gpu_usage = get_gpu_info()
+    # Add current time and system info if requested
+    current_time, current_date = _clock_strings(int(time.time() // 60))
 
-            context += f"""\n\nCurrent system information:
-- Current time: {current_time}
-- Current date: {current_date}
-- CPU Usage: {cpu_usage}%
-- Memory Usage: {memory}%
-- OS: {platform.system()} {platform.release()}"""
+    if not include_sys_info:
+        return f"{context}\n\nCurrent time: {current_time}, {current_date}"
 
-            if gpu_name != "No GPU detected":
-                context += f"\n- GPU: {gpu_name} (Usage: {gpu_usage})"
+    # Only the dynamic fields are filled in per call; the GPU name is cached,
+    # so the driver is only asked for utilization, and only if there's a GPU
+    cpu_usage, memory = sample_system()
+    fields = {
+        "time": current_time,
+        "date": current_date,
+        "cpu": cpu_usage,
+        "mem": memory,
+    }
+    if get_gpu_name() != "No GPU detected":
+        fields["gpu_usage"] = get_gpu_utilization()
+    return _sys_info_template(professional_mode).format_map(fields)
 
-            context += "\n\nFeel free to reference this system information in your responses when relevant."
-        else:
-            context += f"\n\nCurrent time: {current_time}, {current_date}"
+class LLMBase:
+    # Providers declare their own attributes in __slots__ too, so instances carry no __dict__
+    __slots__ = ("config",)
+
+    def __init__(self, config: Dict):
+        # Default max tokens if not specified (increased to allow for longer,
+        # more detailed responses). The caller's dict is copied rather than
+        # filled in, so the default never leaks back into the loaded config.
+        self.config = {"max_tokens": 1000, **config}
 
-        return context
+    # Shared by every provider; it doesn't depend on the instance
+    get_system_context = staticmethod(_build_system_context)
 
     async def generate_response(self, query: str, include_sys_info: bool = False, professional_mode: bool = False) -> str:
         raise NotImplementedError
 
+    async def stream_response(self, query: str, include_sys_info: bool = False, professional_mode: bool = False) -> AsyncIterator[str]:
+        """Yield the response in chunks as it is generated.
+        
+        Providers without streaming support yield the full response at once.
+        """
+        yield await self.generate_response(query, include_sys_info, professional_mode)
+
     async def list_models(self) -> List[Tuple[str, str]]:
         """List available models for this provider.
         
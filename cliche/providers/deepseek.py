@@ -3,10 +3,12 @@ DeepSeek provider implementation
 """
 import os
 from typing import Dict, List, Tuple
-import requests
 from .base import LLMBase
+from ..utils.http_pool import get_httpx_client, httpx_request_with_retry
 
 class DeepSeekProvider(LLMBase):
+    __slots__ = ("api_key", "api_base")
+
     def __init__(self, config: Dict):
         super().__init__(config)
         if 'api_key' not in config:
@@ -27,11 +29,17 @@ class DeepSeekProvider(LLMBase):
                     {"role": "system", "content": self.get_system_context(include_sys_info, professional_mode)},
                     {"role": "user", "content": query}
                 ],
-                "max_tokens": self.config.get('max_tokens', 50000),
+                "max_tokens": self.config['max_tokens'],
                 "temperature": 0.7
             }
             
-            response = requests.post(
+            # Awaited on the loop's pooled client, so batched queries overlap
+            # instead of blocking the event loop one at a time; rate limits and
+            # gateway errors are retried like the other providers' requests
+            client = await get_httpx_client()
+            response = await httpx_request_with_retry(
+                client,
+                "POST",
                 api_url,
                 headers=headers,
                 json=payload
@@ -39,7 +47,7 @@ class DeepSeekProvider(LLMBase):
             
             if response.status_code != 200:
                 error_detail = f"Status: {response.status_code}, Response: {response.text}"
-                return f"💡 DeepSeek Error: {response.status_code} - {response.reason}. Details: {response.text}"
+                return f"💡 DeepSeek Error: {response.status_code} - {response.reason_phrase}. Details: {response.text}"
                 
             response.raise_for_status()
             return response.json()['choices'][0]['message']['content']
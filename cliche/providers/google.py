@@ -2,19 +2,24 @@
 Google provider implementation
 """
 import os
-from typing import Dict, List, Tuple
-import google.generativeai as genai
+from typing import AsyncIterator, Dict, List, Tuple
 from .base import LLMBase
 
 class GoogleProvider(LLMBase):
+    __slots__ = ("genai",)
+
     def __init__(self, config: Dict):
         super().__init__(config)
+        # Imported here so only the active provider's SDK gets loaded
+        import google.generativeai as genai
+        self.genai = genai
         genai.configure(api_key=config.get('api_key') or os.getenv('GOOGLE_API_KEY'))
 
     async def generate_response(self, query: str, include_sys_info: bool = False, professional_mode: bool = False) -> str:
         try:
-            model = genai.GenerativeModel(self.config['model'])
-            response = model.generate_content([
+            model = self.genai.GenerativeModel(self.config['model'])
+            # The async call keeps the event loop free, so batched queries overlap
+            response = await model.generate_content_async([
                 {"role": "system", "content": self.get_system_context(include_sys_info, professional_mode)},
                 {"role": "user", "content": query}
             ])
@@ -22,6 +27,20 @@ class GoogleProvider(LLMBase):
         except Exception as e:
             return f"Google Error: {str(e)}"
 
+    async def stream_response(self, query: str, include_sys_info: bool = False, professional_mode: bool = False) -> AsyncIterator[str]:
+        """Yield response text as Gemini generates it."""
+        try:
+            model = self.genai.GenerativeModel(self.config['model'])
+            response = await model.generate_content_async([
+                {"role": "system", "content": self.get_system_context(include_sys_info, professional_mode)},
+                {"role": "user", "content": query}
+            ], stream=True)
+            async for chunk in response:
+                if chunk.text:
+                    yield chunk.text
+        except Exception as e:
+            yield f"Google Error: {str(e)}"
+
     async def list_models(self) -> List[Tuple[str, str]]:
         """List available Google models."""
         try:
@@ -2,14 +2,82 @@
 Ollama provider implementation
 """
 import os
-from typing import Dict, List, Tuple
-import requests
+import json
+import time
+from pathlib import Path
+from typing import AsyncIterator, Dict, List, Optional, Tuple
+import aiohttp
+
+try:
+    import ijson
+    HAS_IJSON = True
+except ImportError:
+    HAS_IJSON = False
+
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
 from .base import LLMBase
+from ..utils.http_pool import get_aiohttp_session
+
+# The installed models rarely change, so `cliche models` reads them from disk
+TAGS_CACHE_FILE = Path.home() / ".config" / "cliche" / "ollama_tags.json"
+DEFAULT_TAGS_CACHE_TTL = 3600  # seconds
+
+_JSON_HEADERS = {"Content-Type": "application/json"}
+
+def _dumps(obj) -> bytes:
+    """Encode a request body, with orjson when it's installed."""
+    return orjson.dumps(obj) if HAS_ORJSON else json.dumps(obj).encode()
+
+def _loads(data: bytes):
+    """Decode a response body, with orjson when it's installed."""
+    return orjson.loads(data) if HAS_ORJSON else json.loads(data)
+
+def _trim_model(model: Dict) -> Dict:
+    """Keep only the /api/tags fields that are shown and cached."""
+    return {'name': model['name'], 'size': model.get('size', 'unknown')}
+
+def _read_tags_cache(host: str) -> Optional[Tuple[float, List[Dict]]]:
+    """Read the cached /api/tags models for a host.
+    
+    Returns:
+        (timestamp, models), or None if there is no usable cache for the host
+    """
+    try:
+        with open(TAGS_CACHE_FILE) as f:
+            cache = json.load(f)
+        if cache.get('host') != host:
+            return None
+        return cache['ts'], cache['models']
+    except (OSError, ValueError, KeyError):
+        return None
+
+def _write_tags_cache(host: str, models: List[Dict]) -> None:
+    """Store the /api/tags models for a host."""
+    tmp_file = TAGS_CACHE_FILE.with_suffix(".json.tmp")
+    try:
+        TAGS_CACHE_FILE.parent.mkdir(parents=True, exist_ok=True)
+        with open(tmp_file, "w") as f:
+            json.dump({'host': host, 'ts': time.time(), 'models': models}, f)
+        os.replace(tmp_file, TAGS_CACHE_FILE)
+    except (OSError, TypeError):
+        # The cache is only an optimization; a failed write (including a
+        # value json can't serialize) mustn't fail the listing or leave the
+        # temp file behind
+        try:
+            tmp_file.unlink()
+        except OSError:
+            pass
 
 class OllamaProvider(LLMBase):
+    __slots__ = ("base_url", "model", "max_tokens", "tags_cache_ttl")
+
     def __init__(self, config):
         """Initialize the Ollama provider."""
-        
+
         # Check if config is a Config object or a dictionary
         if hasattr(config, 'get_provider_config'):
             # Config object
@@ -17,45 +85,94 @@ class OllamaProvider(LLMBase):
         else:
             # Dictionary
             provider_config = config
-        
+
         # Get configuration values with proper defaults
         self.base_url = provider_config.get('host', 'http://localhost:11434')
         self.model = provider_config.get('model', 'llama3')
         self.max_tokens = provider_config.get('max_tokens', 2048)
+        self.tags_cache_ttl = provider_config.get('models_cache_ttl', DEFAULT_TAGS_CACHE_TTL)
         # Rest of initialization...
 
+    def _generate_body(self, query: str, include_sys_info: bool, professional_mode: bool, stream: bool) -> bytes:
+        """Encode an /api/generate request."""
+        return _dumps({
+            "model": self.model,
+            "system": self.get_system_context(include_sys_info, professional_mode),
+            "prompt": query,
+            "stream": stream,
+            "options": {
+                "num_predict": self.max_tokens
+            }
+        })
+
     async def generate_response(self, query: str, include_sys_info: bool = False, professional_mode: bool = False) -> str:
         try:
-            response = requests.post(
+            session = await get_aiohttp_session()
+            async with session.post(
                 f"{self.base_url}/api/generate",
-                json={
-                    "model": self.model,
-                    "system": self.get_system_context(include_sys_info, professional_mode),
-                    "prompt": query,
-                    "stream": False,
-                    "options": {
-                        "num_predict": self.max_tokens
-                    }
-                }
-            )
-            response.raise_for_status()
-            return response.json()['response']
+                data=self._generate_body(query, include_sys_info, professional_mode, stream=False),
+                headers=_JSON_HEADERS
+            ) as response:
+                response.raise_for_status()
+                data = _loads(await response.read())
+            return data['response']
         except Exception as e:
             return f"Ollama Error: {str(e)}"
 
+    async def stream_response(self, query: str, include_sys_info: bool = False, professional_mode: bool = False) -> AsyncIterator[str]:
+        """Yield response tokens as Ollama generates them."""
+        try:
+            session = await get_aiohttp_session()
+            async with session.post(
+                f"{self.base_url}/api/generate",
+                data=self._generate_body(query, include_sys_info, professional_mode, stream=True),
+                headers=_JSON_HEADERS
+            ) as response:
+                response.raise_for_status()
+                # Ollama streams one JSON object per line
+                async for line in response.content:
+                    if not line.strip():
+                        continue
+                    chunk = _loads(line)
+                    if chunk.get('response'):
+                        yield chunk['response']
+                    if chunk.get('done'):
+                        break
+        except Exception as e:
+            yield f"Ollama Error: {str(e)}"
+
+    def _format_models(self, models: List[Dict]) -> List[Tuple[str, str]]:
+        """Turn /api/tags entries into (model_id, description) tuples."""
+        return sorted(
+            (model['name'], f"Local model, size: {model.get('size', 'unknown')}")
+            for model in models
+        )
+
     async def list_models(self) -> List[Tuple[str, str]]:
         """List available Ollama models."""
+        cached = _read_tags_cache(self.base_url)
+        if cached is not None and time.time() - cached[0] < self.tags_cache_ttl:
+            return self._format_models(cached[1])
+
         try:
-            response = requests.get(f"{self.base_url}/api/tags")
-            response.raise_for_status()
-            models = []
-            for model in response.json().get('models', []):
-                models.append((
-                    model['name'],
-                    f"Local model, size: {model.get('size', 'unknown')}"
-                ))
-            return sorted(models)
-        except requests.exceptions.ConnectionError:
+            session = await get_aiohttp_session()
+            async with session.get(f"{self.base_url}/api/tags") as response:
+                response.raise_for_status()
+                if HAS_IJSON:
+                    # Parse models one at a time as the body arrives; use_float
+                    # keeps non-integer numbers as floats rather than Decimals,
+                    # which json can't serialize into the tags cache
+                    raw_models = ijson.items_async(response.content, 'models.item', use_float=True)
+                    models = [_trim_model(model) async for model in raw_models]
+                else:
+                    data = _loads(await response.read())
+                    models = [_trim_model(model) for model in data.get('models', [])]
+            _write_tags_cache(self.base_url, models)
+            return self._format_models(models)
+        except aiohttp.ClientConnectionError:
+            # A stale list beats no list when the server is unreachable
+            if cached is not None:
+                return self._format_models(cached[1])
             return [("Error", "Failed to connect to Ollama server")]
         except Exception as e:
-            return [("Error", f"Failed to fetch models: {str(e)}")]
\ No newline at end of file
+            return [("Error", f"Failed to fetch models: {str(e)}")]
@@ -2,36 +2,68 @@
 OpenAI provider implementation
 """
 import os
-from typing import Dict, List, Tuple
-from openai import OpenAI
+from typing import AsyncIterator, Dict, List, Tuple
 from .base import LLMBase
+from ..utils.http_pool import get_sdk_client
 
 class OpenAIProvider(LLMBase):
+    __slots__ = ("_client_class", "api_key")
+
     def __init__(self, config: Dict):
         super().__init__(config)
-        self.client = OpenAI(api_key=config.get('api_key') or os.getenv('OPENAI_API_KEY'))
+        # Imported here so only the active provider's SDK gets loaded
+        from openai import AsyncOpenAI
+        self._client_class = AsyncOpenAI
+        self.api_key = config.get('api_key') or os.getenv('OPENAI_API_KEY')
+
+    async def _get_client(self):
+        """Get the process-wide client, which sends requests through the shared connection pool."""
+        return await get_sdk_client(self._client_class, self.api_key)
 
     async def generate_response(self, query: str, include_sys_info: bool = False, professional_mode: bool = False) -> str:
         try:                 
             # Get the configured model or use gpt-4o as default
             model = self.config.get('model', 'gpt-4o')
             
-            response = self.client.chat.completions.create(
+            client = await self._get_client()
+            response = await client.chat.completions.create(
                 model=model,  # Use the configured model
                 messages=[
                     {"role": "system", "content": self.get_system_context(include_sys_info, professional_mode)},
                     {"role": "user", "content": query}
                 ],
-                max_tokens=self.config.get('max_tokens', 1000)  # Use our new default
+                max_tokens=self.config['max_tokens']
             )
             return response.choices[0].message.content
         except Exception as e:
             return f"OpenAI Error: {str(e)}"
 
+    async def stream_response(self, query: str, include_sys_info: bool = False, professional_mode: bool = False) -> AsyncIterator[str]:
+        """Yield response tokens as OpenAI generates them."""
+        try:
+            model = self.config.get('model', 'gpt-4o')
+            
+            client = await self._get_client()
+            stream = await client.chat.completions.create(
+                model=model,
+                messages=[
+                    {"role": "system", "content": self.get_system_context(include_sys_info, professional_mode)},
+                    {"role": "user", "content": query}
+                ],
+                max_tokens=self.config['max_tokens'],
+                stream=True
+            )
+            async for chunk in stream:
+                if chunk.choices and chunk.choices[0].delta.content:
+                    yield chunk.choices[0].delta.content
+        except Exception as e:
+            yield f"OpenAI Error: {str(e)}"
+
     async def list_models(self) -> List[Tuple[str, str]]:
         """List available OpenAI models."""
         try:
-            response = self.client.models.list()
+            client = await self._get_client()
+            response = await client.models.list()
             models = []
             for model in response.data:
                 # Add O-series models and legacy models
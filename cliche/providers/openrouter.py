@@ -3,24 +3,43 @@ OpenRouter provider implementation
 """
 import os
 from typing import Dict, List, Tuple
-import requests
 from .base import LLMBase
+from ..utils.http_pool import get_aiohttp_session, request_with_retry
+
+# Offered when the model list can't be fetched
+_FALLBACK_MODELS = [
+    ("deepseek/deepseek-r1:free", "DeepSeek R1 (free)"),
+    ("cognitivecomputations/dolphin3.0-r1-mistral-24b:free", "Dolphin 3.0 R1 Mistral 24B (free)"),
+    ("meta-llama/llama-3.3-70b-instruct:free", "Llama 3.3 70B Instruct (free)"),
+    ("asophosympatheia/rogue-rose-103b-v0.2:free", "Rogue Rose 103B v0.2 (free)"),
+    ("gryphe/mythomax-l2-13b:free", "MythoMax L2 13B (free)"),
+    ("google/gemma-2-9b-it:free", "Gemma 2 9B IT (free)"),
+]
 
 class OpenRouterProvider(LLMBase):
+    __slots__ = ("api_key", "api_base", "_headers")
+
     def __init__(self, config: Dict):
         super().__init__(config)
         self.api_key = config.get('api_key') or os.getenv('OPENROUTER_API_KEY')
         self.api_base = "https://openrouter.ai/api/v1"
+        # Every request carries the same headers, so they are built once.
+        # They stay off the session itself because it is shared with other providers.
+        self._headers = {
+            "Authorization": f"Bearer {self.api_key}",
+            "HTTP-Referer": "https://github.com/sizzlebop/cliche",  # Required by OpenRouter
+            "X-Title": "CLIche"  # Required by OpenRouter
+        }
 
     async def generate_response(self, query: str, include_sys_info: bool = False, professional_mode: bool = False) -> str:
         try:
-            response = requests.post(
+            # Awaited on the loop's pooled session, so batched queries overlap
+            # instead of blocking the event loop one at a time
+            session = await get_aiohttp_session()
+            async with await request_with_retry(
+                session, "POST",
                 f"{self.api_base}/chat/completions",
-                headers={
-                    "Authorization": f"Bearer {self.api_key}",
-                    "HTTP-Referer": "https://github.com/sizzlebop/cliche",  # Required by OpenRouter
-                    "X-Title": "CLIche"  # Required by OpenRouter
-                },
+                headers=self._headers,
                 json={
                     "model": self.config['model'],
                     "messages": [
@@ -28,26 +47,25 @@ class OpenRouterProvider(LLMBase):
                         {"role": "user", "content": query}
                     ]
                 }
-            )
-            response.raise_for_status()
-            return response.json()['choices'][0]['message']['content']
+            ) as response:
+                response.raise_for_status()
+                data = await response.json()
+            return data['choices'][0]['message']['content']
         except Exception as e:
             return f"OpenRouter Error: {str(e)}"
 
     async def list_models(self) -> List[Tuple[str, str]]:
         """List available OpenRouter models."""
         try:
-            response = requests.get(
-                "https://openrouter.ai/api/v1/models",
-                headers={
-                    "Authorization": f"Bearer {self.api_key}",
-                    "HTTP-Referer": "https://github.com/sizzlebop/cliche",  # Required by OpenRouter
-                    "X-Title": "CLIche"  # Required by OpenRouter
-                }
-            )
-            response.raise_for_status()
+            session = await get_aiohttp_session()
+            async with await request_with_retry(
+                session, "GET",
+                f"{self.api_base}/models",
+                headers=self._headers
+            ) as response:
+                response.raise_for_status()
+                data = await response.json()
             
-            data = response.json()
             models = []
             for model in data.get('data', []):
                 # Format pricing info
@@ -61,15 +79,8 @@ class OpenRouterProvider(LLMBase):
                     f"{pricing}"
                 )
                 models.append((model['id'], description))
-            return sorted(models, key=lambda x: x[1]) if models else [("deepseek/deepseek-r1:free")]
+            return sorted(models, key=lambda x: x[1]) if models else list(_FALLBACK_MODELS)
         except Exception as e:
             print(f"Error fetching models: {str(e)}")  # Add error logging
             # Fallback to basic models if API fails
-            return [
-                ("deepseek/deepseek-r1:free"),
-                ("cognitivecomputations/dolphin3.0-r1-mistral-24b:free"),
-                ("meta-llama/llama-3.3-70b-instruct:free"),                
-                ("asophosympatheia/rogue-rose-103b-v0.2:free"),
-                ("gryphe/mythomax-l2-13b:free"),
-                ("google/gemma-2-9b-it:free")
-            ]
+            return list(_FALLBACK_MODELS)
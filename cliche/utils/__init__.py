@@ -1,47 +1,42 @@
 """
 Utility functions and classes
 """
-from .gpu import get_gpu_info
-from .docker import get_docker_containers
-from .unsplash import UnsplashAPI, format_image_for_markdown, format_image_for_html, get_photo_credit
+import importlib
 
-# Import image generation modules
-try:
-    from .image_generation import ImageGenerator, ImageProvider
-    from .dalle import DALLEGenerator
-    from .stability import StabilityGenerator
-    __image_generation_available = True
-except ImportError:
-    __image_generation_available = False
+# Exported name -> submodule. Submodules are imported on first access, so
+# importing one utility (gpu, ttl_cache, ...) doesn't drag in requests,
+# aiohttp and the image libraries behind the others.
+_EXPORTS = {
+    'get_gpu_info': '.gpu',
+    'get_gpu_name': '.gpu',
+    'get_gpu_utilization': '.gpu',
+    'get_docker_containers': '.docker',
+    'UnsplashAPI': '.unsplash',
+    'format_image_for_markdown': '.unsplash',
+    'format_image_for_html': '.unsplash',
+    'get_photo_credit': '.unsplash',
+}
 
-# Import image scraping modules
-try:
-    from .image_scraper import extract_and_download_images, ScrapedImage
-    __image_scraper_available = True
-except ImportError:
-    __image_scraper_available = False
+# These need the optional image dependencies, so they are importable by name
+# but left out of __all__; a star import must not fail without the extras
+_OPTIONAL_EXPORTS = {
+    # Image generation
+    'ImageGenerator': '.image_generation',
+    'ImageProvider': '.image_generation',
+    'DALLEGenerator': '.dalle',
+    'StabilityGenerator': '.stability',
+    # Image scraping
+    'extract_and_download_images': '.image_scraper',
+    'ScrapedImage': '.image_scraper',
+}
 
-__all__ = [
-    'get_gpu_info', 
-    'get_docker_containers',
-    'UnsplashAPI',
-    'format_image_for_markdown',
-    'format_image_for_html',
-    'get_photo_credit'
-]
+def __getattr__(name: str):
+    """Import the submodule providing `name` when it is first used."""
+    module_name = _EXPORTS.get(name) or _OPTIONAL_EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
 
-# Add image generation modules if available
-if __image_generation_available:
-    __all__.extend([
-        'ImageGenerator',
-        'ImageProvider',
-        'DALLEGenerator',
-        'StabilityGenerator'
-    ])
-
-# Add image scraper modules if available
-if __image_scraper_available:
-    __all__.extend([
-        'extract_and_download_images',
-        'ScrapedImage'
-    ])
+__all__ = list(_EXPORTS)
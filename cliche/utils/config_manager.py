@@ -12,9 +12,15 @@ import os
 import sys
 import logging
 from pathlib import Path
-import datetime
+import time
 import shutil
 
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
 # Set up logging
 logger = logging.getLogger("cliche.config_manager")
 
@@ -55,6 +61,14 @@ DEFAULT_CONFIG = {
   }
 }
 
+def _write_json(path, data):
+    """Write data as indented JSON, with orjson when it's installed."""
+    if HAS_ORJSON:
+        path.write_bytes(orjson.dumps(data, option=orjson.OPT_INDENT_2))
+    else:
+        with open(path, "w") as f:
+            json.dump(data, f, indent=2)
+
 def get_config_path():
     """Get the path to the config file."""
     return Path.home() / ".config" / "cliche" / "config.json"
@@ -71,19 +85,19 @@ def ensure_config_exists():
     config_dir = get_config_dir()
     config_path = get_config_path()
     
+    # Check if the config file exists; this runs on every import, so the
+    # common case is a single stat
+    if config_path.exists():
+        logger.info(f"Config file already exists at {config_path}")
+        return False
+    
     # Create the directory if it doesn't exist
     if not config_dir.exists():
         logger.info(f"Creating config directory: {config_dir}")
         config_dir.mkdir(parents=True, exist_ok=True)
     
-    # Check if the config file exists
-    if config_path.exists():
-        logger.info(f"Config file already exists at {config_path}")
-        return False
-    
     # Create the config file with the default template
-    with open(config_path, "w") as f:
-        json.dump(DEFAULT_CONFIG, f, indent=2)
+    _write_json(config_path, DEFAULT_CONFIG)
     
     logger.info(f"Created default config file at {config_path}")
     return True
@@ -99,7 +113,7 @@ def backup_config():
         return None
     
     # Create a backup with timestamp
-    timestamp = datetime.datetime.now().strftime("%Y%m%d_%H%M%S")
+    timestamp = time.strftime("%Y%m%d_%H%M%S")
     backup_path = config_path.with_suffix(f".backup_{timestamp}.json")
     
     try:
@@ -121,26 +135,25 @@ def load_config():
     # Load the config
     config_path = get_config_path()
     try:
-        with open(config_path, "r") as f:
-            config = json.load(f)
-        return config
+        data = config_path.read_bytes()
+        return orjson.loads(data) if HAS_ORJSON else json.loads(data)
     except Exception as e:
         logger.error(f"Failed to load config: {e}")
         return DEFAULT_CONFIG
 
-def save_config(config):
+def save_config(config, backup=True):
     """
     Save the configuration to the config file.
-    Creates a backup of the existing file first.
+    Creates a backup of the existing file first, unless the caller already made one.
     """
     # Create a backup first
-    backup_config()
+    if backup:
+        backup_config()
     
     # Save the config
     config_path = get_config_path()
     try:
-        with open(config_path, "w") as f:
-            json.dump(config, f, indent=2)
+        _write_json(config_path, config)
         logger.info(f"Saved config to {config_path}")
         return True
     except Exception as e:
@@ -1,22 +1,92 @@
 """
 Docker-related utility functions
 """
+import http.client
 import json
+import os
+import socket
 import subprocess
-from typing import Dict
+from typing import Dict, List, Optional
+from .ttl_cache import ttl_cache
 
-def get_docker_containers() -> Dict:
-    """Get list of running docker containers with their details."""
+DEFAULT_DOCKER_SOCKET = "/var/run/docker.sock"
+
+class _UnixHTTPConnection(http.client.HTTPConnection):
+    """HTTP connection over a UNIX domain socket."""
+
+    def __init__(self, socket_path: str, timeout: float = 2.0):
+        super().__init__("localhost", timeout=timeout)
+        self.socket_path = socket_path
+
+    def connect(self):
+        self.sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        self.sock.settimeout(self.timeout)
+        self.sock.connect(self.socket_path)
+
+def _get_socket_path() -> str:
+    """Get the Docker Engine socket, honouring a unix:// DOCKER_HOST."""
+    docker_host = os.environ.get("DOCKER_HOST", "")
+    if docker_host.startswith("unix://"):
+        return docker_host[len("unix://"):]
+    return DEFAULT_DOCKER_SOCKET
+
+def _format_ports(ports: List[Dict]) -> str:
+    """Format Engine API port bindings the way `docker ps` prints them."""
+    formatted = []
+    for port in ports:
+        private = f"{port['PrivatePort']}/{port.get('Type', 'tcp')}"
+        if 'PublicPort' in port:
+            formatted.append(f"{port.get('IP', '')}:{port['PublicPort']}->{private}")
+        else:
+            formatted.append(private)
+    return ', '.join(formatted)
+
+def _get_containers_from_socket() -> Optional[Dict]:
+    """Query running containers from the Docker Engine API.
+
+    Returns:
+        Containers keyed by short ID, or None if the socket can't be used
+    """
+    socket_path = _get_socket_path()
+    if not os.path.exists(socket_path):
+        return None
+
+    conn = _UnixHTTPConnection(socket_path)
+    try:
+        conn.request("GET", "/containers/json")
+        response = conn.getresponse()
+        if response.status != 200:
+            return None
+        data = json.loads(response.read())
+    except (OSError, http.client.HTTPException, json.JSONDecodeError):
+        # Missing permissions on the socket, daemon not running, etc.
+        return None
+    finally:
+        conn.close()
+
+    containers = {}
+    for container in data:
+        containers[container['Id'][:12]] = {
+            'name': ','.join(name.lstrip('/') for name in container.get('Names', [])),
+            'image': container['Image'],
+            'status': container['Status'],
+            'ports': _format_ports(container.get('Ports', []))
+        }
+    return containers
+
+def _get_containers_from_cli() -> Dict:
+    """Query running containers by running `docker ps`."""
     try:
         result = subprocess.run(
             ['docker', 'ps', '--format', '{{json .}}'],
-            capture_output=True,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
             text=True
         )
-        
+
         if result.returncode != 0:
             return {}
-            
+
         containers = {}
         for line in result.stdout.strip().split('\n'):
             if line:
@@ -30,7 +100,16 @@ def get_docker_containers() -> Dict:
                     }
                 except json.JSONDecodeError:
                     continue
-                    
+
         return containers
     except (subprocess.SubprocessError, FileNotFoundError):
         return {}
+
+@ttl_cache(seconds=5)
+def get_docker_containers() -> Dict:
+    """Get list of running docker containers with their details."""
+    # Talking to the daemon directly avoids starting the docker CLI
+    containers = _get_containers_from_socket()
+    if containers is not None:
+        return containers
+    return _get_containers_from_cli()
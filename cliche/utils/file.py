@@ -28,20 +28,11 @@ def get_output_dir(type: Literal['code', 'write', 'scrape', 'docs']) -> Path:
     Returns:
         Path object for the output directory
     """
-    # Get user's home directory
-    home = Path.home()
-    
-    # Create base cliche directory if it doesn't exist (removing the dot to make it visible)
-    cliche_dir = home / 'cliche'
-    cliche_dir.mkdir(exist_ok=True)
-    
-    # Create files directory if it doesn't exist
-    files_dir = cliche_dir / 'files'
-    files_dir.mkdir(exist_ok=True)
-    
-    # Create type-specific directory if it doesn't exist
-    output_dir = files_dir / type
-    output_dir.mkdir(exist_ok=True)
+    # ~/cliche/files/<type> (no leading dot, so it's visible). Creating the leaf
+    # with parents=True is a single mkdir once the tree exists, instead of one
+    # mkdir per level on every call.
+    output_dir = Path.home() / 'cliche' / 'files' / type
+    output_dir.mkdir(parents=True, exist_ok=True)
     
     return output_dir
 
@@ -74,20 +65,9 @@ def get_image_dir() -> Path:
     Returns:
         Path object for the images directory
     """
-    # Get user's home directory
-    home = Path.home()
-    
-    # Create base cliche directory
-    cliche_dir = home / 'cliche'
-    cliche_dir.mkdir(exist_ok=True)
-    
-    # Create files directory
-    files_dir = cliche_dir / 'files'
-    files_dir.mkdir(exist_ok=True)
-    
-    # Create images directory
-    images_dir = files_dir / 'images'
-    images_dir.mkdir(exist_ok=True)
+    # Create ~/cliche/files/images and any missing parents in one call
+    images_dir = Path.home() / 'cliche' / 'files' / 'images'
+    images_dir.mkdir(parents=True, exist_ok=True)
     
     return images_dir
 
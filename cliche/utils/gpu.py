@@ -1,44 +1,173 @@
 """
 GPU information utilities
 """
+import atexit
+import ctypes
+import functools
+import os
+import shutil
 import subprocess
-from typing import Tuple
+from pathlib import Path
+from typing import Optional, Tuple
+from .ttl_cache import ttl_cache
 
-try:
-    import py3nvml as nvml
-    HAS_NVIDIA = True
-except ImportError:
-    HAS_NVIDIA = False
+class NvmlUtilization(ctypes.Structure):
+    """Mirror of NVML's nvmlUtilization_t."""
+    _fields_ = [("gpu", ctypes.c_uint), ("memory", ctypes.c_uint)]
+
+_NVML_LIBRARY_NAMES = ("libnvidia-ml.so.1", "nvml.dll")
+_NVML_SUCCESS = 0
+_NVML_DEVICE_NAME_BUFFER_SIZE = 96
+
+_PCI_DEVICES_DIR = Path('/sys/bus/pci/devices')
+# VGA compatible, 3D and other display controllers
+_PCI_DISPLAY_CLASSES = frozenset({'0300', '0302', '0380'})
+_PCI_VENDORS = {
+    '10de': 'NVIDIA',
+    '1002': 'AMD',
+    '8086': 'Intel',
+}
+
+@functools.lru_cache(maxsize=1)
+def _has_nvidia_driver() -> bool:
+    """Probe once for an NVIDIA driver so CPU-only machines never try NVML or nvidia-smi."""
+    return shutil.which('nvidia-smi') is not None or os.path.exists('/proc/driver/nvidia/version')
+
+# NVML is loaded and initialized once per process, on the first GPU query so
+# commands that never ask about the GPU don't pay for it; the first device
+# handle and the utilization struct are reused for every query
+_libnvml = None
+_nvml_handle = None
+_nvml_util = NvmlUtilization()
+
+@functools.lru_cache(maxsize=1)
+def _init_nvml() -> None:
+    """Load the NVML library, initialize it and cache the handle of the first GPU."""
+    global _libnvml, _nvml_handle
+    if not _has_nvidia_driver():
+        return
+    for library_name in _NVML_LIBRARY_NAMES:
+        try:
+            lib = ctypes.CDLL(library_name)
+            break
+        except OSError:
+            continue
+    else:
+        return
 
-def get_gpu_info() -> Tuple[str, str]:
-    """Get GPU information and utilization."""
     try:
-        # Try nvidia-smi first
-        result = subprocess.run(['nvidia-smi', '--query-gpu=gpu_name,utilization.gpu', '--format=csv,noheader,nounits'],
-                            capture_output=True, text=True, check=True)
-        if result.stdout.strip():
-            gpu_name, utilization = result.stdout.strip().split(',')
-            return gpu_name.strip(), f"{utilization.strip()}%"
-    except (subprocess.SubprocessError, FileNotFoundError):
-        # If nvidia-smi fails, try py3nvml
-        if HAS_NVIDIA:
-            try:
-                nvml.nvmlInit()
-                handle = nvml.nvmlDeviceGetHandleByIndex(0)
-                name = nvml.nvmlDeviceGetName(handle)
-                util = nvml.nvmlDeviceGetUtilizationRates(handle)
-                nvml.nvmlShutdown()
-                return name, f"{util.gpu}%"
-            except Exception:
-                pass
-
-        # Try lspci as a last resort
+        if lib.nvmlInit_v2() != _NVML_SUCCESS:
+            return
+        atexit.register(lib.nvmlShutdown)
+        handle = ctypes.c_void_p()
+        if lib.nvmlDeviceGetHandleByIndex_v2(0, ctypes.byref(handle)) != _NVML_SUCCESS:
+            return
+    except AttributeError:
+        # Library too old to export the v2 entry points
+        return
+
+    _libnvml = lib
+    _nvml_handle = handle
+
+def get_gpu_metrics() -> Optional[int]:
+    """Get the GPU utilization percentage straight from NVML.
+    
+    Returns:
+        Utilization percentage, or None if NVML isn't available
+    """
+    _init_nvml()
+    if _nvml_handle is None:
+        return None
+    if _libnvml.nvmlDeviceGetUtilizationRates(_nvml_handle, ctypes.byref(_nvml_util)) != _NVML_SUCCESS:
+        return None
+    return _nvml_util.gpu
+
+def _get_pci_gpu_name() -> Optional[str]:
+    """Find a display controller in sysfs without spawning lspci.
+    
+    Returns:
+        A name built from the vendor and PCI IDs, or None if none is found
+    """
+    try:
+        devices = sorted(_PCI_DEVICES_DIR.iterdir())
+    except OSError:
+        return None
+
+    for device in devices:
         try:
-            result = subprocess.run('lspci | grep -i "vga\\|3d\\|display"', 
-                                shell=True, capture_output=True, text=True)
-            if result.stdout:
-                return result.stdout.strip().split(':')[-1].strip(), "N/A"
+            # The class file holds e.g. "0x030000"; the first four hex digits are class + subclass
+            if (device / 'class').read_text().strip()[2:6] not in _PCI_DISPLAY_CLASSES:
+                continue
+            vendor_id = (device / 'vendor').read_text().strip()[2:]
+            device_id = (device / 'device').read_text().strip()[2:]
+        except OSError:
+            continue
+        vendor = _PCI_VENDORS.get(vendor_id, 'Unknown vendor')
+        return f"{vendor} GPU [{vendor_id}:{device_id}]"
+
+    return None
+
+@functools.lru_cache(maxsize=1)
+def get_gpu_name() -> str:
+    """Get the GPU name. It can't change while the process runs, so it is cached.
+    
+    Pair it with get_gpu_utilization() for the reading that does change.
+    """
+    # Fast path: query NVML directly without spawning a process
+    _init_nvml()
+    if _nvml_handle is not None:
+        name = ctypes.create_string_buffer(_NVML_DEVICE_NAME_BUFFER_SIZE)
+        if _libnvml.nvmlDeviceGetName(_nvml_handle, name, len(name)) == _NVML_SUCCESS:
+            return name.value.decode()
+
+    if _has_nvidia_driver():
+        try:
+            # Fall back to nvidia-smi
+            result = subprocess.run(['nvidia-smi', '--query-gpu=gpu_name', '--format=csv,noheader,nounits'],
+                                stdout=subprocess.PIPE, stderr=subprocess.DEVNULL, text=True, check=True)
+            if result.stdout.strip():
+                return result.stdout.strip().splitlines()[0].strip()
         except (subprocess.SubprocessError, FileNotFoundError):
             pass
 
-    return "No GPU detected", "N/A"
+    # Scan PCI devices as a last resort (also finds non-NVIDIA GPUs)
+    gpu_name = _get_pci_gpu_name()
+    if gpu_name:
+        return gpu_name
+
+    return "No GPU detected"
+
+@ttl_cache(seconds=2)
+def _get_smi_utilization() -> str:
+    """Get GPU utilization from nvidia-smi, reusing the answer for a couple of seconds.
+    
+    This only runs when NVML can't be used, and spawning nvidia-smi for every
+    LLM turn would cost far more than the reading is worth.
+    """
+    try:
+        result = subprocess.run(['nvidia-smi', '--query-gpu=utilization.gpu', '--format=csv,noheader,nounits'],
+                            stdout=subprocess.PIPE, stderr=subprocess.DEVNULL, text=True, check=True)
+        if result.stdout.strip():
+            return f"{result.stdout.strip().splitlines()[0].strip()}%"
+    except (subprocess.SubprocessError, FileNotFoundError):
+        pass
+
+    return "N/A"
+
+def get_gpu_utilization() -> str:
+    """Get the current GPU utilization as a percentage string."""
+    if not _has_nvidia_driver():
+        return "N/A"
+
+    utilization = get_gpu_metrics()
+    if utilization is not None:
+        return f"{utilization}%"
+
+    return _get_smi_utilization()
+
+def get_gpu_info() -> Tuple[str, str]:
+    """Get GPU information and utilization."""
+    gpu_name = get_gpu_name()
+    if gpu_name == "No GPU detected":
+        return gpu_name, "N/A"
+    return gpu_name, get_gpu_utilization()
@@ -0,0 +1,123 @@
+"""
+Shared HTTP connection pools for the LLM providers.
+
+Pooled async connections belong to the event loop that opened them, and
+commands such as research call asyncio.run() more than once. Each running
+loop therefore gets its own async pools, which are closed when that loop
+shuts down.
+"""
+import asyncio
+import aiohttp
+import httpx
+
+# Limits high enough that batched requests aren't throttled by the pool
+MAX_CONNECTIONS = 2000
+MAX_KEEPALIVE_CONNECTIONS = 1500
+TIMEOUT = 120.0
+# Keep idle connections around between turns (aiohttp drops them after 15s by default)
+KEEPALIVE_TIMEOUT = 30.0
+# Statuses that mean the server didn't process the request, so it is safe to resend
+RETRY_STATUSES = (429, 502, 503, 504)
+STATUS_RETRIES = 3
+BACKOFF_FACTOR = 0.5
+# Longest Retry-After worth waiting for; a CLI shouldn't sit idle for minutes
+MAX_RETRY_DELAY = 10.0
+
+# event loop -> {"httpx": AsyncClient, "aiohttp": ClientSession, "sdk": {(class, api_key): client},
+#                "lifetime": async generator}
+_pools = {}
+
+async def _close_on_shutdown(pool: dict):
+    """Close a loop's pools once the loop finalizes its async generators."""
+    try:
+        yield
+    finally:
+        _pools.pop(asyncio.get_running_loop(), None)
+        if "httpx" in pool:
+            await pool["httpx"].aclose()
+        if "aiohttp" in pool:
+            await pool["aiohttp"].close()
+
+async def _get_pool() -> dict:
+    """Get the pool registry for the running event loop."""
+    loop = asyncio.get_running_loop()
+    pool = _pools.get(loop)
+    if pool is None:
+        pool = _pools[loop] = {}
+        # asyncio.run() calls shutdown_asyncgens() before closing the loop,
+        # which runs the finally block above
+        lifetime = _close_on_shutdown(pool)
+        await lifetime.__anext__()
+        pool["lifetime"] = lifetime
+    return pool
+
+async def get_httpx_client() -> httpx.AsyncClient:
+    """Get the shared httpx client for the running event loop."""
+    pool = await _get_pool()
+    if "httpx" not in pool:
+        pool["httpx"] = httpx.AsyncClient(
+            limits=httpx.Limits(
+                max_connections=MAX_CONNECTIONS,
+                max_keepalive_connections=MAX_KEEPALIVE_CONNECTIONS
+            ),
+            timeout=TIMEOUT
+        )
+    return pool["httpx"]
+
+async def get_aiohttp_session() -> aiohttp.ClientSession:
+    """Get the shared aiohttp session for the running event loop."""
+    pool = await _get_pool()
+    if "aiohttp" not in pool:
+        pool["aiohttp"] = aiohttp.ClientSession(
+            connector=aiohttp.TCPConnector(limit=MAX_CONNECTIONS,
+                                           keepalive_timeout=KEEPALIVE_TIMEOUT),
+            timeout=aiohttp.ClientTimeout(total=TIMEOUT)
+        )
+    return pool["aiohttp"]
+
+async def get_sdk_client(client_class, api_key: str):
+    """Get a provider SDK client (AsyncOpenAI, AsyncAnthropic, ...) for the running event loop.
+    
+    Clients are shared by every provider instance using the same API key and
+    send their requests through the loop's httpx client, which they don't own,
+    so they need no closing of their own.
+    """
+    pool = await _get_pool()
+    clients = pool.setdefault("sdk", {})
+    key = (client_class, api_key)
+    if key not in clients:
+        clients[key] = client_class(api_key=api_key, http_client=await get_httpx_client())
+    return clients[key]
+
+async def request_with_retry(session: aiohttp.ClientSession, method: str, url: str, **kwargs) -> aiohttp.ClientResponse:
+    """Send a request, resending it while the server answers with a RETRY_STATUSES code.
+    
+    Waits for Retry-After when the server gives one in seconds, otherwise backs
+    off exponentially. A Retry-After longer than MAX_RETRY_DELAY isn't waited
+    out; that response is returned straight away. The last response is
+    returned whatever its status, so callers can report it; use it as
+    `async with await request_with_retry(...)`.
+    """
+    for attempt in range(STATUS_RETRIES + 1):
+        response = await session.request(method, url, **kwargs)
+        if response.status not in RETRY_STATUSES or attempt == STATUS_RETRIES:
+            return response
+        retry_after = response.headers.get("Retry-After", "")
+        delay = float(retry_after) if retry_after.isdigit() else BACKOFF_FACTOR * 2 ** attempt
+        if delay > MAX_RETRY_DELAY:
+            return response
+        response.release()
+        await asyncio.sleep(delay)
+
+async def httpx_request_with_retry(client: httpx.AsyncClient, method: str, url: str, **kwargs) -> httpx.Response:
+    """httpx counterpart of request_with_retry, with the same retry and Retry-After rules."""
+    for attempt in range(STATUS_RETRIES + 1):
+        response = await client.request(method, url, **kwargs)
+        if response.status_code not in RETRY_STATUSES or attempt == STATUS_RETRIES:
+            return response
+        retry_after = response.headers.get("Retry-After", "")
+        delay = float(retry_after) if retry_after.isdigit() else BACKOFF_FACTOR * 2 ** attempt
+        if delay > MAX_RETRY_DELAY:
+            return response
+        await response.aclose()
+        await asyncio.sleep(delay)
@@ -9,6 +9,7 @@ import re
 import asyncio
 import aiohttp
 import hashlib
+import time
 import warnings
 import logging
 import requests
@@ -424,8 +425,7 @@ async def extract_and_download_images_async(html_content: str, base_url: str,
             subfolder = f"scraped_{domain}"
         
         # Add timestamp to ensure uniqueness
-        import datetime
-        timestamp = datetime.datetime.now().strftime("%Y%m%d_%H%M%S")
+        timestamp = time.strftime("%Y%m%d_%H%M%S")
         subfolder = f"{subfolder}_{timestamp}"
         
         output_dir = base_output_dir / subfolder
@@ -486,8 +486,7 @@ def extract_and_download_images(html_content: str, base_url: str,
             subfolder = f"scraped_{domain}"
         
         # Add timestamp to ensure uniqueness
-        import datetime
-        timestamp = datetime.datetime.now().strftime("%Y%m%d_%H%M%S")
+        timestamp = time.strftime("%Y%m%d_%H%M%S")
         subfolder = f"{subfolder}_{timestamp}"
         
         output_dir = base_output_dir / subfolder
@@ -0,0 +1,38 @@
+"""
+Cheap system sampling shared by the system command and the LLM system context
+"""
+import platform
+import time
+from typing import Tuple
+import psutil
+from .ttl_cache import ttl_cache
+
+# The OS can't change while the process runs, so it is looked up once at import
+OS_NAME = platform.system()
+OS_STRING = f"{OS_NAME} {platform.release()}"
+
+# cpu_percent(interval=None) measures usage since the previous call and
+# returns a meaningless 0.0 the first time, so prime it at import. Never pass
+# interval > 0 here: that blocks for the whole interval.
+psutil.cpu_percent(interval=None)
+_last_cpu_read = time.monotonic()
+
+def cpu_percent(min_window: float = 0.0) -> float:
+    """Get CPU usage since the previous reading without blocking for a fixed interval.
+    
+    Args:
+        min_window: Shortest span (seconds) the reading may cover; only the
+            part of it that hasn't already passed since the last reading is slept
+    """
+    global _last_cpu_read
+    remaining = min_window - (time.monotonic() - _last_cpu_read)
+    if remaining > 0:
+        time.sleep(remaining)
+    usage = psutil.cpu_percent(interval=None)
+    _last_cpu_read = time.monotonic()
+    return usage
+
+@ttl_cache(seconds=1)
+def sample_system() -> Tuple[float, float]:
+    """Sample CPU and memory usage, reusing the sample for up to a second."""
+    return cpu_percent(), psutil.virtual_memory().percent
@@ -0,0 +1,33 @@
+"""
+Time-based caching for expensive system probes
+"""
+import functools
+import time
+from typing import Callable
+
+def ttl_cache(seconds: float) -> Callable:
+    """Cache a function's results for a limited time.
+
+    Results are keyed on the call arguments and recomputed once they are
+    older than `seconds`. The wrapped function gains a `cache_clear()` method.
+
+    Args:
+        seconds: How long a cached result stays valid
+    """
+    def decorator(func: Callable) -> Callable:
+        cache = {}  # call arguments -> (timestamp, result)
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            key = (args, tuple(sorted(kwargs.items())))
+            now = time.monotonic()
+            entry = cache.get(key)
+            if entry is not None and now - entry[0] < seconds:
+                return entry[1]
+            result = func(*args, **kwargs)
+            cache[key] = (now, result)
+            return result
+
+        wrapper.cache_clear = cache.clear
+        return wrapper
+    return decorator
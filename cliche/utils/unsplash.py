@@ -4,11 +4,23 @@ Handles searching, downloading, and managing images from Unsplash.
 """
 import os
 import json
+import functools
 import requests
 from pathlib import Path
 from typing import List, Dict, Any, Optional, Tuple
 import click
 from .file import get_output_dir
+from .http_pool import get_aiohttp_session
+
+
+@functools.lru_cache(maxsize=1)
+def _get_requests_session() -> requests.Session:
+    """Get the session shared by the blocking Unsplash calls, so they reuse keep-alive connections.
+    
+    The async methods use the event loop's pooled aiohttp session instead.
+    """
+    return requests.Session()
+
 
 class UnsplashAPI:
     """Wrapper for the Unsplash API."""
@@ -52,7 +64,53 @@ class UnsplashAPI:
         
         # Create image directory if it doesn't exist
         self.image_dir = get_image_dir()
+    
+    # The blocking and async methods share these, so they differ only in
+    # how the request is sent
+    
+    def _search_request(self, query: str, page: int, per_page: int) -> Tuple[str, Dict[str, Any]]:
+        """Get the URL and query parameters for a photo search."""
+        url = f"{self.api_base}/search/photos"
+        params = {
+            "query": query,
+            "page": page,
+            "per_page": per_page
+        }
+        return url, params
+    
+    def _photo_endpoint(self, photo_id: str) -> str:
+        """Get the API URL for a photo."""
+        return f"{self.api_base}/photos/{photo_id}"
+    
+    def _download_endpoint(self, photo_id: str) -> str:
+        """Get the API URL that records a photo download."""
+        return f"{self.api_base}/photos/{photo_id}/download"
+    
+    @staticmethod
+    def _photo_url_data(photo: Dict[str, Any], width: int, height: int) -> dict:
+        """Build get_photo_url's URL and metadata dictionary from a photo's details."""
+        # Get direct URLs
+        url = photo["urls"]["regular"]  # Use the "regular" sized image (1080px)
+        
+        # If specific dimensions requested, use the raw URL with dimensions
+        if width or height:
+            url = photo["urls"]["raw"] + f"&w={width}&h={height}&fit=crop"
+        
+        # Get photographer info
+        photographer_name = photo["user"]["name"]
+        photographer_username = photo["user"]["username"]
+        photographer_url = f"https://unsplash.com/@{photographer_username}?utm_source=cliche&utm_medium=referral"
         
+        # Return URL and metadata
+        return {
+            "url": url,
+            "alt_text": photo.get("description") or photo.get("alt_description") or "Image from Unsplash",
+            "photographer_name": photographer_name,
+            "photographer_username": photographer_username,
+            "photographer_url": photographer_url,
+            "unsplash_url": "https://unsplash.com/?utm_source=cliche&utm_medium=referral"
+        }
+    
     def search_photos(self, query: str, page: int = 1, per_page: int = 10) -> Dict[str, Any]:
         """Search for photos on Unsplash.
         
@@ -64,14 +122,8 @@ class UnsplashAPI:
         Returns:
             Dictionary with search results
         """
-        url = f"{self.api_base}/search/photos"
-        params = {
-            "query": query,
-            "page": page,
-            "per_page": per_page
-        }
-        
-        response = requests.get(url, headers=self.headers, params=params)
+        url, params = self._search_request(query, page, per_page)
+        response = _get_requests_session().get(url, headers=self.headers, params=params)
         response.raise_for_status()
         return response.json()
     
@@ -84,8 +136,7 @@ class UnsplashAPI:
         Returns:
             Dictionary with photo details
         """
-        url = f"{self.api_base}/photos/{photo_id}"
-        response = requests.get(url, headers=self.headers)
+        response = _get_requests_session().get(self._photo_endpoint(photo_id), headers=self.headers)
         response.raise_for_status()
         return response.json()
     
@@ -120,13 +171,13 @@ class UnsplashAPI:
         # Create output path
         output_path = self.image_dir / filename
         
-        # Download the image
-        response = requests.get(download_url, stream=True)
-        response.raise_for_status()
-        
-        with open(output_path, 'wb') as f:
-            for chunk in response.iter_content(chunk_size=8192):
-                f.write(chunk)
+        # Download the image; the with block hands the connection back to the pool
+        with _get_requests_session().get(download_url, stream=True) as response:
+            response.raise_for_status()
+            
+            with open(output_path, 'wb') as f:
+                for chunk in response.iter_content(chunk_size=8192):
+                    f.write(chunk)
         
         return output_path
     
@@ -136,9 +187,8 @@ class UnsplashAPI:
         Args:
             photo_id: The Unsplash photo ID
         """
-        url = f"{self.api_base}/photos/{photo_id}/download"
         try:
-            requests.get(url, headers=self.headers)
+            _get_requests_session().get(self._download_endpoint(photo_id), headers=self.headers)
         except Exception:
             # Don't fail if tracking fails
             pass
@@ -160,45 +210,77 @@ class UnsplashAPI:
         # Track download (required by Unsplash API terms)
         self._track_download(photo_id)
         
-        # Get direct URLs
-        url = photo["urls"]["regular"]  # Use the "regular" sized image (1080px)
+        return self._photo_url_data(photo, width, height)
+
+    async def search_photos_async(self, query: str, page: int = 1, per_page: int = 10) -> Dict[str, Any]:
+        """Search for photos on Unsplash using the pooled async session.
         
-        # If specific dimensions requested, use the raw URL with dimensions
-        if width or height:
-            url = photo["urls"]["raw"] + f"&w={width}&h={height}&fit=crop"
+        Args:
+            query: Search query
+            page: Page number
+            per_page: Number of results per page
+            
+        Returns:
+            Dictionary with search results
+        """
+        session = await get_aiohttp_session()
+        url, params = self._search_request(query, page, per_page)
+        async with session.get(url, headers=self.headers, params=params) as response:
+            response.raise_for_status()
+            return await response.json()
+
+    async def get_photo_async(self, photo_id: str) -> Dict[str, Any]:
+        """Get a specific photo by ID using the pooled async session.
         
-        # Get photographer info
-        photographer_name = photo["user"]["name"]
-        photographer_username = photo["user"]["username"]
-        photographer_url = f"https://unsplash.com/@{photographer_username}?utm_source=cliche&utm_medium=referral"
+        Args:
+            photo_id: The Unsplash photo ID
+            
+        Returns:
+            Dictionary with photo details
+        """
+        session = await get_aiohttp_session()
+        async with session.get(self._photo_endpoint(photo_id), headers=self.headers) as response:
+            response.raise_for_status()
+            return await response.json()
+
+    async def _track_download_async(self, photo_id: str) -> None:
+        """Track a download using the pooled async session.
         
-        # Return URL and metadata
-        return {
-            "url": url,
-            "alt_text": photo.get("description") or photo.get("alt_description") or "Image from Unsplash",
-            "photographer_name": photographer_name,
-            "photographer_username": photographer_username,
-            "photographer_url": photographer_url,
-            "unsplash_url": "https://unsplash.com/?utm_source=cliche&utm_medium=referral"
-        }
+        Args:
+            photo_id: The Unsplash photo ID
+        """
+        try:
+            session = await get_aiohttp_session()
+            async with session.get(self._download_endpoint(photo_id), headers=self.headers):
+                pass
+        except Exception:
+            # Don't fail if tracking fails
+            pass
+
+    async def get_photo_url_async(self, photo_id: str, width: int = 1600, height: int = 900) -> dict:
+        """Async version of get_photo_url that reuses pooled connections.
+        
+        Args:
+            photo_id: The Unsplash photo ID
+            width: Desired width
+            height: Desired height
+            
+        Returns:
+            Dictionary with photo URL and metadata
+        """
+        photo = await self.get_photo_async(photo_id)
+        
+        # Track download (required by Unsplash API terms)
+        await self._track_download_async(photo_id)
+        
+        return self._photo_url_data(photo, width, height)
 
 
 def get_image_dir() -> Path:
     """Get the directory for storing downloaded images."""
-    # Get user's home directory
-    home = Path.home()
-    
-    # Create base cliche directory if it doesn't exist (removing the dot to make it visible)
-    cliche_dir = home / 'cliche'
-    cliche_dir.mkdir(exist_ok=True)
-    
-    # Create files directory if it doesn't exist
-    files_dir = cliche_dir / 'files'
-    files_dir.mkdir(exist_ok=True)
-    
-    # Create images directory if it doesn't exist
-    images_dir = files_dir / 'images'
-    images_dir.mkdir(exist_ok=True)
+    # Create ~/cliche/files/images and any missing parents in one call
+    images_dir = Path.home() / 'cliche' / 'files' / 'images'
+    images_dir.mkdir(parents=True, exist_ok=True)
     
     return images_dir
 
@@ -12,9 +12,10 @@ setup(
         'google-generativeai>=0.3.0',
         'psutil>=5.9.0',
         'requests>=2.31.0',
-        'python-dotenv>=1.0.0',
+        'aiohttp>=3.8.0',
+        'httpx>=0.23.0',
+        'aiofiles>=22.1.0',
         'asyncio>=3.4.3',
-        'py3nvml>=0.2.7',
         'setuptools>=58.0.4',
         'crawl4ai>=0.4.3',
         'beautifulsoup4>=4.12.0',
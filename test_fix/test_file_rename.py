@@ -0,0 +1,115 @@
+#!/usr/bin/env python3
+"""
+Tests for `cliche rename` overwriting an existing target with --force.
+"""
+import os
+import stat
+import sys
+
+from click.testing import CliRunner
+
+# Add the project root to the Python path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from cliche.commands.file import rename
+
+
+def _rename(source, target):
+    return CliRunner().invoke(rename, [str(source), str(target), "--force"])
+
+
+def test_file_replaces_file(tmp_path):
+    source = tmp_path / "a.txt"
+    target = tmp_path / "b.txt"
+    source.write_text("new")
+    target.write_text("old")
+
+    result = _rename(source, target)
+
+    assert "Renamed" in result.output
+    assert not source.exists()
+    assert target.read_text() == "new"
+
+
+def test_file_does_not_replace_non_empty_dir(tmp_path):
+    source = tmp_path / "a.txt"
+    target = tmp_path / "dir"
+    source.write_text("new")
+    target.mkdir()
+    (target / "keep.txt").write_text("keep")
+
+    result = _rename(source, target)
+
+    assert "Refusing to overwrite" in result.output
+    assert source.read_text() == "new"
+    assert (target / "keep.txt").read_text() == "keep"
+
+
+def test_file_replaces_empty_dir(tmp_path):
+    source = tmp_path / "a.txt"
+    target = tmp_path / "dir"
+    source.write_text("new")
+    target.mkdir()
+
+    result = _rename(source, target)
+
+    assert "Renamed" in result.output
+    assert target.is_file()
+    assert target.read_text() == "new"
+
+
+def test_dir_replaces_file(tmp_path):
+    source = tmp_path / "src"
+    target = tmp_path / "b.txt"
+    source.mkdir()
+    (source / "inner.txt").write_text("inner")
+    target.write_text("old")
+
+    result = _rename(source, target)
+
+    assert "Renamed" in result.output
+    assert not source.exists()
+    assert (target / "inner.txt").read_text() == "inner"
+
+
+def test_dir_does_not_replace_non_empty_dir(tmp_path):
+    source = tmp_path / "src"
+    target = tmp_path / "dst"
+    source.mkdir()
+    (source / "inner.txt").write_text("inner")
+    target.mkdir()
+    (target / "keep.txt").write_text("keep")
+
+    result = _rename(source, target)
+
+    assert "Refusing to overwrite" in result.output
+    assert (source / "inner.txt").read_text() == "inner"
+    assert (target / "keep.txt").read_text() == "keep"
+
+
+def test_dir_replaces_empty_dir(tmp_path):
+    source = tmp_path / "src"
+    target = tmp_path / "dst"
+    source.mkdir()
+    (source / "inner.txt").write_text("inner")
+    target.mkdir()
+
+    result = _rename(source, target)
+
+    assert "Renamed" in result.output
+    assert not source.exists()
+    assert (target / "inner.txt").read_text() == "inner"
+
+
+def test_file_replaces_read_only_file(tmp_path):
+    source = tmp_path / "a.txt"
+    target = tmp_path / "b.txt"
+    source.write_text("new")
+    target.write_text("old")
+    target.chmod(stat.S_IREAD)
+
+    result = _rename(source, target)
+
+    assert "Renamed" in result.output
+    assert not source.exists()
+    assert target.read_text() == "new"